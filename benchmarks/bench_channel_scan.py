@@ -0,0 +1,36 @@
+"""
+bench_channel_scan.py — Wall-clock time and upstream request count for channel-scan tools.
+
+Runs get_top_videos (a 200-video uploads scan) against the local fake Data
+API (benchmarks/fake_youtube.py).
+
+    python benchmarks/bench_channel_scan.py [--latency 0.1] [--runs 3]
+"""
+
+import argparse
+import time
+
+import fake_youtube
+import main
+
+CHANNEL_URL = "https://www.youtube.com/@benchmark"
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latency", type=float, default=0.1, help="Fake upstream latency per request (s)")
+    parser.add_argument("--runs", type=int, default=3, help="Number of get_top_videos calls")
+    args = parser.parse_args()
+
+    fake = fake_youtube.connect(latency=args.latency)
+
+    for run_no in range(1, args.runs + 1):
+        before = fake.request_count
+        start = time.perf_counter()
+        main.get_top_videos(CHANNEL_URL, limit=10)
+        elapsed = time.perf_counter() - start
+        print(f"run {run_no}: {elapsed:.3f}s, {fake.request_count - before} upstream requests")
+
+
+if __name__ == "__main__":
+    run()
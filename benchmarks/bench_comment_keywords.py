@@ -0,0 +1,75 @@
+"""
+bench_comment_keywords.py — Keyword extraction time on 500 comments.
+
+Times the process-wide analyzer behind get_comment_keywords counting 500
+synthetic comments. When NLTK with its punkt_tab and stopwords data is
+installed, the old per-call word_tokenize pipeline is timed on the same
+text for comparison.
+No network or fake API is involved.
+
+    python benchmarks/bench_comment_keywords.py [--comments 500] [--runs 20]
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main  # noqa: E402
+
+VOCAB = (
+    "great video tutorial python music editing camera lighting audio script thanks "
+    "awesome helpful explained clearly please more content subscribe don't can't it's "
+    "you're I've we'll wasn't amazing. love! really?? gonna wanna well-known 10/10 "
+    "the and this that with for was but not you your are have"
+).split()
+
+
+def _comments(n: int) -> list:
+    rng = random.Random(42)
+    return [" ".join(rng.choice(VOCAB) for _ in range(rng.randint(5, 40))) for _ in range(n)]
+
+
+def _old_pipeline(texts: list) -> Counter | None:
+    """The previous get_comment_keywords body, minus the downloads; None without NLTK data."""
+    try:
+        from nltk.corpus import stopwords
+        from nltk.tokenize import word_tokenize
+        stop = set(stopwords.words("english"))
+        tokens = word_tokenize(" ".join(texts).lower())
+    except (ImportError, LookupError):
+        return None
+    return Counter(w for w in tokens if w.isalpha() and len(w) >= 3 and w not in stop)
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--comments", type=int, default=500, help="Synthetic comments per run")
+    parser.add_argument("--runs", type=int, default=20, help="Timed runs")
+    args = parser.parse_args()
+    texts = _comments(args.comments)
+
+    timings = []
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        counter = main._keyword_analyzer.count(texts)
+        timings.append(time.perf_counter() - start)
+    print(f"analyzer, {args.comments} comments: median {statistics.median(timings) * 1000:.2f} ms")
+    print(f"top 5: {counter.most_common(5)}")
+
+    start = time.perf_counter()
+    old = _old_pipeline(texts)
+    if old is None:
+        print("word_tokenize pipeline: skipped (NLTK punkt_tab/stopwords data not installed)")
+        return
+    print(f"word_tokenize pipeline: {(time.perf_counter() - start) * 1000:.2f} ms")
+    print(f"same counts as word_tokenize: {old == counter}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,59 @@
+"""
+bench_comment_replies.py — Requests to read 100 comment threads with their replies.
+
+Against the local fake Data API (benchmarks/fake_youtube.py), whose threads
+have 0-12 replies with the first 5 inlined: get_video_comments with
+include_replies vs. the naive pattern of one comments.list per thread
+that has replies.
+
+    python benchmarks/bench_comment_replies.py [--limit 100] [--cap 20] [--latency 0.05]
+"""
+
+import argparse
+import time
+
+import fake_youtube
+import main
+
+VIDEO_ID = "vid00000001"
+
+
+async def _naive(limit: int, cap: int) -> int:
+    """Top-level comments, then comments.list for every thread with replies, one after another."""
+    replies = 0
+    async for page in main._iter_comment_pages_async(VIDEO_ID, limit, replies_per_thread=1):
+        for comment in page:
+            if comment["reply_count"]:
+                replies += len(await main._get_replies_async(comment["comment_id"], cap))
+    return replies
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--limit", type=int, default=100, help="Comment threads to read")
+    parser.add_argument("--cap", type=int, default=20, help="Replies kept per thread")
+    parser.add_argument("--latency", type=float, default=0.05, help="Fake upstream latency per request (s)")
+    args = parser.parse_args()
+
+    fake = fake_youtube.connect(latency=args.latency)
+
+    before = fake.request_count
+    start = time.perf_counter()
+    replies = main._run(_naive(args.limit, args.cap))
+    print(
+        f"per-thread comments.list: {fake.request_count - before} requests, "
+        f"{replies} replies, {time.perf_counter() - start:.3f}s"
+    )
+
+    fake_youtube.reset_caches()
+    before = fake.request_count
+    start = time.perf_counter()
+    result = main.get_video_comments(VIDEO_ID, limit=args.limit, include_replies=True, replies_per_thread=args.cap)
+    print(
+        f"include_replies:          {fake.request_count - before} requests, "
+        f"{result['returned_reply_count']} replies, {time.perf_counter() - start:.3f}s"
+    )
+
+
+if __name__ == "__main__":
+    run()
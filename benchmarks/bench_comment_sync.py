@@ -0,0 +1,54 @@
+"""
+bench_comment_sync.py — Cost of monitoring a video's comments, full vs. incremental.
+
+Against the local fake Data API (benchmarks/fake_youtube.py): reads the
+newest 500 comments of a video once in full, then polls it incrementally
+while a few new comments get posted between some polls. Caches stay
+warm, as in a real server: polls run well inside the 3-minute comment
+cache TTL, and each must still report exactly the comments posted since
+the previous one.
+
+    python benchmarks/bench_comment_sync.py [--limit 500] [--polls 5] [--latency 0.05]
+"""
+
+import argparse
+import time
+
+import fake_youtube
+import main
+
+VIDEO_ID = "vid00000001"
+
+
+def _poll(fake, incremental: bool, limit: int) -> tuple:
+    before = fake.request_count
+    start = time.perf_counter()
+    with main.track_call("get_video_comments") as stats:
+        result = main.get_video_comments(VIDEO_ID, limit=limit, incremental=incremental)
+    return result, fake.request_count - before, stats.units, time.perf_counter() - start
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--limit", type=int, default=500, help="Comments kept per poll")
+    parser.add_argument("--polls", type=int, default=5, help="Polls after the initial read")
+    parser.add_argument("--latency", type=float, default=0.05, help="Fake upstream latency per request (s)")
+    args = parser.parse_args()
+
+    fake = fake_youtube.connect(latency=args.latency)
+
+    _, requests_made, units, elapsed = _poll(fake, False, args.limit)
+    print(f"full read:    {requests_made} requests, {units} units, {elapsed:.3f}s")
+    _, requests_made, units, elapsed = _poll(fake, True, args.limit)
+    print(f"initial sync: {requests_made} requests, {units} units, {elapsed:.3f}s")
+    for poll in range(1, args.polls + 1):
+        posted = 7 if poll % 2 else 0
+        fake.new_comments += posted
+        result, requests_made, units, elapsed = _poll(fake, True, args.limit)
+        print(
+            f"poll {poll} ({posted} posted): {requests_made} requests, {units} units, {elapsed:.3f}s, "
+            f"{result['new_comment_count']} new, newest {result['comments'][0]['comment_id']}"
+        )
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,73 @@
+"""
+bench_concurrent_dispatch.py — N concurrent server.call_tool requests vs. the same calls run serially.
+
+Runs against the local fake Data API (benchmarks/fake_youtube.py), so the
+numbers reflect dispatch behaviour rather than real network conditions.
+
+    python benchmarks/bench_concurrent_dispatch.py [--latency 0.05]
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+import fake_youtube
+import main
+import server
+
+CHANNEL_URL = f"https://www.youtube.com/channel/{fake_youtube.CHANNEL_ID}"
+
+CALLS = [
+    ("get_video_comments", {"video_id": "vid00000001", "limit": 500}),
+    ("get_top_videos", {"channel_url": CHANNEL_URL, "limit": 10}),
+    ("get_channel_overview", {"channel_url": CHANNEL_URL}),
+    ("get_video_details", {"video_id": "vid00000002"}),
+    ("get_video_seo_score", {"video_id": "vid00000003"}),
+    ("get_engagement_stats", {"channel_url": CHANNEL_URL, "limit": 100}),
+]
+
+
+async def _timed(name: str, args: dict) -> float:
+    start = time.perf_counter()
+    result = await server.call_tool(name, args)
+    if result.isError:
+        raise RuntimeError(f"{name} failed: {result.content[0].text}")
+    return time.perf_counter() - start
+
+
+async def _serial() -> tuple:
+    start = time.perf_counter()
+    durations = [await _timed(name, args) for name, args in CALLS]
+    return time.perf_counter() - start, durations
+
+
+async def _concurrent() -> float:
+    start = time.perf_counter()
+    await asyncio.gather(*(_timed(name, args) for name, args in CALLS))
+    return time.perf_counter() - start
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latency", type=float, default=0.05, help="Fake upstream latency per request (s)")
+    args = parser.parse_args()
+    logging.getLogger("youtube-mcp").setLevel(logging.WARNING)
+
+    fake = fake_youtube.connect(latency=args.latency)
+
+    # Every phase pays full upstream cost, not a replay of the previous phase.
+    fake_youtube.reset_caches(cached=False)
+    serial_total, durations = asyncio.run(_serial())
+    fake_youtube.reset_caches(cached=False)
+    concurrent_total = asyncio.run(_concurrent())
+
+    print(f"calls:               {len(CALLS)}")
+    print(f"slowest single call: {max(durations):.3f}s")
+    print(f"serial (sum):        {serial_total:.3f}s")
+    print(f"concurrent:          {concurrent_total:.3f}s")
+    print(f"speedup:             {serial_total / concurrent_total:.2f}x")
+
+
+if __name__ == "__main__":
+    run()
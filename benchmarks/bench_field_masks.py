@@ -0,0 +1,54 @@
+"""
+bench_field_masks.py — Response bytes per tool call with and without `fields` masks.
+
+Runs each tool once with YOUTUBE_FIELD_MASKS off and once on, against the
+local fake Data API (benchmarks/fake_youtube.py), with caches cleared
+between calls so every call goes upstream.
+
+    python benchmarks/bench_field_masks.py
+"""
+
+
+import fake_youtube
+import main
+
+CHANNEL_URL = "https://www.youtube.com/@benchmark"
+
+CALLS = [
+    ("get_channel_overview", lambda: main.get_channel_overview(CHANNEL_URL)),
+    ("get_channel_videos", lambda: main.get_channel_videos(CHANNEL_URL, limit=50)),
+    ("get_channel_topics", lambda: main.get_channel_topics(CHANNEL_URL)),
+    ("get_top_videos", lambda: main.get_top_videos(CHANNEL_URL)),
+    ("get_video_details", lambda: main.get_video_details("vid00000001")),
+    ("get_video_comments", lambda: main.get_video_comments("vid00000001", limit=100)),
+    ("get_trending_videos", lambda: main.get_trending_videos(limit=25)),
+    ("compare_videos", lambda: main.compare_videos(["vid00000001", "vid00000002"])),
+    ("get_video_seo_score", lambda: main.get_video_seo_score("vid00000003")),
+]
+
+
+def _measure(fake, call) -> int:
+    fake_youtube.reset_caches(cached=False)
+    before = fake.bytes_sent
+    call()
+    return fake.bytes_sent - before
+
+
+def run() -> None:
+    fake = fake_youtube.connect(latency=0)
+
+    print(f"{'tool':<24}{'no mask':>12}{'masked':>12}{'saved':>8}")
+    totals = [0, 0]
+    for name, call in CALLS:
+        main.FIELD_MASKS = False
+        unmasked = _measure(fake, call)
+        main.FIELD_MASKS = True
+        masked = _measure(fake, call)
+        totals[0] += unmasked
+        totals[1] += masked
+        print(f"{name:<24}{unmasked:>12,}{masked:>12,}{1 - masked / unmasked:>8.0%}")
+    print(f"{'total':<24}{totals[0]:>12,}{totals[1]:>12,}{1 - totals[1] / totals[0]:>8.0%}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,48 @@
+"""
+bench_key_pool.py — Calls served before quota runs out, with one key vs. a pool.
+
+Gives each key a small quota on the local fake Data API
+(benchmarks/fake_youtube.py) and issues uncached get_video_details calls
+until the server reports every key as quotaExceeded.
+
+    python benchmarks/bench_key_pool.py [--quota 25] [--keys 3]
+"""
+
+import argparse
+
+import fake_youtube
+import main
+
+
+def _served(fake, keys: list, quota: int) -> int:
+    fake.key_quota.update({key: quota for key in keys})
+    # The local ledger is left generous so the upstream 403s drive rotation.
+    main._key_pool = main._KeyPool(keys, 10_000)
+    main._quota = main._QuotaBudget(10_000 * len(keys), 10_000 * len(keys), 10_000 * len(keys))
+    fake_youtube.reset_caches()
+    calls = 0
+    while True:
+        try:
+            main.get_video_details(f"vid{calls:08d}")
+        except main.QuotaExceededError:
+            return calls
+        calls += 1
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--quota", type=int, default=25, help="Units each key may spend on the fake API")
+    parser.add_argument("--keys", type=int, default=3, help="Keys in the pool")
+    args = parser.parse_args()
+
+    fake = fake_youtube.connect(latency=0.0)
+
+    single = _served(fake, ["bench-key-single"], args.quota)
+    pool = _served(fake, [f"bench-key-{n}" for n in range(args.keys)], args.quota)
+    print(f"1 key:            {single} calls served")
+    print(f"{args.keys} keys (pooled):  {pool} calls served")
+    print(f"upstream requests per key: {dict(fake.key_requests)}")
+
+
+if __name__ == "__main__":
+    run()
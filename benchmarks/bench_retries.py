@@ -0,0 +1,58 @@
+"""
+bench_retries.py — Channel scans under injected upstream failures.
+
+Against the local fake Data API (benchmarks/fake_youtube.py):
+
+  1. a 200-video get_top_videos scan while the fake answers some requests
+     with 503 / 429 (Retry-After) — the scan should still complete;
+  2. repeated calls while the upstream returns nothing but 503s — once the
+     circuit opens, calls should fail fast instead of retrying.
+
+    python benchmarks/bench_retries.py [--latency 0.05]
+"""
+
+import argparse
+import time
+
+import fake_youtube
+import main
+
+CHANNEL_URL = "https://www.youtube.com/@benchmark"
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latency", type=float, default=0.05, help="Fake upstream latency per request (s)")
+    args = parser.parse_args()
+
+    fake = fake_youtube.connect(latency=args.latency)
+
+    fake.faults.extend([(503, None), (429, 0.2), (502, None)])
+    before = fake.request_count
+    start = time.perf_counter()
+    with main.track_call("get_top_videos") as stats:
+        main.get_top_videos(CHANNEL_URL, limit=10)
+    print(
+        f"flaky upstream: scan completed in {time.perf_counter() - start:.3f}s, "
+        f"{fake.request_count - before} requests, {stats.retries} retries"
+    )
+
+    # Drop what the scan above cached so every call below has to reach the
+    # (now dead) upstream.
+    fake_youtube.reset_caches()
+    fake.faults.extend([(503, None)] * 1000)
+    for call in range(1, 5):
+        start = time.perf_counter()
+        try:
+            main.get_video_details(f"vid{call:08d}")
+            outcome = "ok"
+        except ValueError as e:
+            outcome = type(e).__name__
+        except Exception as e:
+            outcome = f"{type(e).__name__} (upstream error)"
+        print(f"dead upstream, call {call}: {outcome} after {time.perf_counter() - start:.3f}s")
+    print(f"breakers: {main.get_breaker_status()}")
+
+
+if __name__ == "__main__":
+    run()
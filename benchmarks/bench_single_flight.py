@@ -0,0 +1,44 @@
+"""
+bench_single_flight.py — Upstream requests for a concurrent fan-out on one channel.
+
+Fires get_engagement_stats, get_top_videos, get_upload_schedule and
+get_tag_analysis for the same channel at once against the local fake Data
+API (benchmarks/fake_youtube.py), with cold caches.
+
+    python benchmarks/bench_single_flight.py [--latency 0.05]
+"""
+
+import argparse
+import asyncio
+import time
+
+import fake_youtube
+import main
+
+CHANNEL_URL = "https://www.youtube.com/@benchmark"
+
+
+async def _fan_out() -> None:
+    await asyncio.gather(
+        main.get_engagement_stats_async(CHANNEL_URL),
+        main.get_top_videos_async(CHANNEL_URL),
+        main.get_upload_schedule_async(CHANNEL_URL),
+        main.get_tag_analysis_async(CHANNEL_URL),
+    )
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latency", type=float, default=0.05, help="Fake upstream latency per request (s)")
+    args = parser.parse_args()
+
+    fake = fake_youtube.connect(latency=args.latency)
+
+    start = time.perf_counter()
+    main._run(_fan_out())
+    print(f"4 concurrent channel tools: {time.perf_counter() - start:.3f}s, {fake.request_count} upstream requests")
+    print(f"single-flight: {main.get_cache_stats()['single_flight']}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,353 @@
+"""
+fake_youtube.py — Local stand-in for the YouTube Data API v3, used by the benchmarks.
+
+Serves deterministic channels / playlistItems / videos / commentThreads / comments
+responses with a configurable per-request latency, so benchmarks measure
+this server's request pattern instead of the real network. Honours the
+`fields` partial-response mask, ETags, gzip negotiation and per-key
+`quotaExceeded` errors like the real API, and can inject transient failures.
+"""
+
+import gzip
+import json
+import os
+import sys
+import threading
+import time
+import zlib
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+# Importers get main from the repo root, with every cache kept in memory so
+# no state is carried over on disk between runs. Import this module first.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("YOUTUBE_MCP_CACHE_DIR", "")
+
+CHANNEL_ID = "UCbenchmarkchannel0000001"
+UPLOADS_ID = "UU" + CHANNEL_ID[2:]
+TOTAL_VIDEOS = 400
+TOTAL_COMMENTS = 2000
+# Like the real API, commentThreads inlines only the first few replies of a thread.
+INLINE_REPLIES = 5
+
+WORDS = (
+    "great video tutorial python music editing camera lighting audio script "
+    "thanks awesome helpful explained clearly please more content subscribe"
+).split()
+
+
+def _video_id(n: int) -> str:
+    return f"vid{n:08d}"
+
+
+def _video_item(n: int) -> dict:
+    return {
+        "kind": "youtube#video",
+        "etag": f"etag-video-{n}",
+        "id": _video_id(n),
+        "snippet": {
+            "publishedAt": f"2024-{(n % 12) + 1:02d}-{(n % 28) + 1:02d}T{n % 24:02d}:00:00Z",
+            "channelId": CHANNEL_ID,
+            "title": f"Benchmark video number {n} about {WORDS[n % len(WORDS)]}",
+            "description": ("Long description line with links https://example.com 0:00 intro\n" * 20),
+            "thumbnails": {
+                q: {"url": f"https://i.ytimg.com/vi/{_video_id(n)}/{q}.jpg", "width": 1280, "height": 720}
+                for q in ("default", "medium", "high", "standard", "maxres")
+            },
+            "channelTitle": "Benchmark Channel",
+            "tags": [WORDS[(n + i) % len(WORDS)] for i in range(12)],
+            "categoryId": "28",
+            "localized": {"title": f"Benchmark video number {n}", "description": "Localized description " * 20},
+        },
+        "contentDetails": {"duration": f"PT{n % 60}M{n % 60}S", "dimension": "2d", "definition": "hd"},
+        "statistics": {
+            "viewCount": str(1000 + n * 37),
+            "likeCount": str(50 + n * 3),
+            "favoriteCount": "0",
+            "commentCount": str(5 + n),
+        },
+    }
+
+
+def _channel_for_handle(handle: str) -> str:
+    """@benchmark is the main channel; @chanN maps to an extra channel; anything else is unknown."""
+    if handle == "benchmark":
+        return CHANNEL_ID
+    if handle.startswith("chan") and handle[4:].isdigit():
+        return f"UCfakechannel{int(handle[4:]):012d}"
+    return ""
+
+
+def _channel_item(channel_id: str) -> dict:
+    n = 0 if channel_id == CHANNEL_ID else int(channel_id[-12:])
+    return {
+        "id": channel_id,
+        "snippet": {"title": f"Channel {n}" if n else "Benchmark Channel", "description": "", "publishedAt": "2015-01-01T00:00:00Z", "thumbnails": {}},
+        "statistics": {"subscriberCount": str(12345 + n), "viewCount": str(987654 + n), "videoCount": str(TOTAL_VIDEOS)},
+        "contentDetails": {"relatedPlaylists": {"uploads": "UU" + channel_id[2:]}},
+        "topicDetails": {"topicCategories": ["https://en.wikipedia.org/wiki/Technology"]},
+    }
+
+
+def _reply_count(n: int) -> int:
+    """Thread n has 0-12 replies; a third of the threads exceed INLINE_REPLIES."""
+    return n % 13
+
+
+def _reply_item(n: int, k: int) -> dict:
+    text = " ".join(WORDS[(n * 5 + k + i) % len(WORDS)] for i in range(8))
+    return {
+        "kind": "youtube#comment",
+        "etag": f"etag-reply-{n}-{k}",
+        "id": f"thread{n:08d}.reply{k:04d}",
+        "snippet": {
+            "parentId": f"thread{n:08d}",
+            "authorDisplayName": f"@replier{k}",
+            "textDisplay": text,
+            "textOriginal": text,
+            "likeCount": k % 7,
+            "publishedAt": f"2024-07-{(k % 28) + 1:02d}T12:00:00Z",
+        },
+    }
+
+
+def _comment_item(n: int, video_id: str) -> dict:
+    text = " ".join(WORDS[(n * 7 + i) % len(WORDS)] for i in range(12))
+    return {
+        "kind": "youtube#commentThread",
+        "etag": f"etag-thread-{n}",
+        "id": f"thread{n:08d}",
+        "snippet": {
+            "videoId": video_id,
+            "topLevelComment": {
+                "id": f"thread{n:08d}",
+                "snippet": {
+                    "authorDisplayName": f"@viewer{n}",
+                    "textDisplay": text,
+                    "textOriginal": text,
+                    "likeCount": n % 40,
+                    "publishedAt": f"2024-06-{(n % 28) + 1:02d}T12:00:00Z",
+                },
+            },
+            "totalReplyCount": _reply_count(n),
+        },
+        "replies": {"comments": [_reply_item(n, k) for k in range(min(_reply_count(n), INLINE_REPLIES))]},
+    }
+
+
+def _parse_selection(text: str, i: int = 0) -> tuple:
+    """Parse a partial-response `fields` mask into {name: subtree or None (= everything)}."""
+    tree = {}
+    while i < len(text) and text[i] != ")":
+        path = []
+        while True:
+            j = i
+            while j < len(text) and text[j] not in ",()/":
+                j += 1
+            path.append(text[i:j])
+            i = j
+            if i < len(text) and text[i] == "/":
+                i += 1
+                continue
+            break
+        sub = None
+        if i < len(text) and text[i] == "(":
+            sub, i = _parse_selection(text, i + 1)
+            i += 1
+        node = tree
+        for name in path[:-1]:
+            node = node.setdefault(name, {})
+        node[path[-1]] = sub
+        if i < len(text) and text[i] == ",":
+            i += 1
+    return tree, i
+
+
+def _apply_fields(value, tree):
+    if tree is None:
+        return value
+    if isinstance(value, list):
+        return [_apply_fields(v, tree) for v in value]
+    if not isinstance(value, dict):
+        return value
+    return {k: _apply_fields(value[k], sub) for k, sub in tree.items() if k in value}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.server.request_count += 1
+        time.sleep(self.server.latency)
+        parsed = urlparse(self.path)
+        endpoint = parsed.path.rstrip("/").rsplit("/", 1)[-1]
+        query = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+        status = 200
+        with self.server.faults_lock:
+            fault = self.server.faults.pop(0) if self.server.faults else None
+        if fault is not None:
+            fault_status, retry_after = fault
+            body = json.dumps({"error": {"code": fault_status, "errors": [{"reason": "backendError"}]}}).encode()
+            self.send_response(fault_status)
+            self.send_header("Content-Type", "application/json; charset=UTF-8")
+            self.send_header("Content-Length", str(len(body)))
+            if retry_after is not None:
+                self.send_header("Retry-After", str(retry_after))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        key = query.get("key", "")
+        self.server.key_requests[key] += 1
+        quota = self.server.key_quota
+        if key in quota and quota[key] <= 0:
+            status, data = 403, {"error": {"code": 403, "errors": [{"reason": "quotaExceeded"}]}}
+        elif endpoint == "playlistItems" and query.get("playlistId") != UPLOADS_ID:
+            status, data = 404, {"error": {"code": 404, "errors": [{"reason": "playlistNotFound"}]}}
+        else:
+            if key in quota:
+                quota[key] -= 1
+            data = self._respond(endpoint, query)
+            data["etag"] = f"etag-{endpoint}"
+            if "fields" in query:
+                data = _apply_fields(data, _parse_selection(query["fields"])[0])
+        body = json.dumps(data).encode()
+        etag = f'"{zlib.crc32(body):08x}"'
+        if status == 200 and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=UTF-8")
+        # Like Google's frontends: gzip only if both headers ask for it.
+        if "gzip" in self.headers.get("Accept-Encoding", "") and "gzip" in self.headers.get("User-Agent", ""):
+            body = gzip.compress(body, compresslevel=6)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+        self.server.bytes_sent += len(body)
+
+    def _respond(self, endpoint: str, query: dict) -> dict:
+        if endpoint == "channels":
+            if "forHandle" in query:
+                ids = [_channel_for_handle(query["forHandle"].lstrip("@"))]
+            else:
+                ids = query.get("id", "").split(",")
+            return {"items": [_channel_item(cid) for cid in ids if cid.startswith("UC")]}
+
+        if endpoint == "playlistItems":
+            uploads = self.server.uploads
+            start = int(query.get("pageToken", "0"))
+            size = int(query.get("maxResults", "50"))
+            stop = min(start + size, len(uploads))
+            data = {"items": [
+                {"contentDetails": {"videoId": _video_id(n)}} for n in uploads[start:stop]
+            ]}
+            if stop < len(uploads):
+                data["nextPageToken"] = str(stop)
+            return data
+
+        if endpoint == "videos":
+            ids = [vid for vid in query.get("id", "").split(",") if vid]
+            if query.get("chart") == "mostPopular":
+                ids = [_video_id(n) for n in range(int(query.get("maxResults", "25")))]
+            return {"items": [
+                _video_item(int(vid[3:])) for vid in ids
+                if vid.startswith("vid") and int(vid[3:]) not in self.server.deleted
+            ]}
+
+        if endpoint == "commentThreads":
+            total = TOTAL_COMMENTS + self.server.new_comments
+            start = int(query.get("pageToken", "0"))
+            size = int(query.get("maxResults", "20"))
+            stop = min(start + size, total)
+            positions = range(start, stop)
+            if query.get("order") == "time":
+                # Newest first: comment numbers count up as comments are posted.
+                positions = [total - 1 - p for p in positions]
+            data = {"items": [_comment_item(n, query.get("videoId", "")) for n in positions]}
+            if "replies" not in query.get("part", ""):
+                for item in data["items"]:
+                    del item["replies"]
+            if stop < total:
+                data["nextPageToken"] = str(stop)
+            return data
+
+        if endpoint == "comments":
+            n = int(query.get("parentId", "thread0")[len("thread"):])
+            start = int(query.get("pageToken", "0"))
+            stop = min(start + int(query.get("maxResults", "20")), _reply_count(n))
+            data = {"items": [_reply_item(n, k) for k in range(start, stop)]}
+            if stop < _reply_count(n):
+                data["nextPageToken"] = str(stop)
+            return data
+
+        return {"items": []}
+
+
+class _Server(ThreadingHTTPServer):
+    # Room for bursts of concurrent connects (the stdlib default backlog is 5).
+    request_queue_size = 128
+
+
+def start(latency: float = 0.05) -> ThreadingHTTPServer:
+    """Start the fake API on a random local port in a daemon thread."""
+    server = _Server(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    server.latency = latency
+    server.request_count = 0
+    server.bytes_sent = 0
+    # Optional per-key remaining units; a key at 0 gets 403 quotaExceeded.
+    server.key_quota = {}
+    server.key_requests = Counter()
+    # Injected failures: (status, retry_after or None) served to the next requests, in order.
+    server.faults = []
+    server.faults_lock = threading.Lock()
+    # Uploads playlist as video numbers, newest first; videos.list omits deleted ones.
+    server.uploads = list(range(TOTAL_VIDEOS))
+    server.deleted = set()
+    # Comments posted on every video since startup (visible with order=time).
+    server.new_comments = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def base_url(server: ThreadingHTTPServer) -> str:
+    return f"http://127.0.0.1:{server.server_port}/youtube/v3"
+
+
+def connect(latency: float = 0.05) -> ThreadingHTTPServer:
+    """Start the fake API and point main's Data API requests at it."""
+    import main
+
+    server = start(latency)
+    main.BASE_URL = base_url(server)
+    return server
+
+
+def reset_caches(cached: bool = True) -> None:
+    """
+    Empty every in-process cache in main: responses, handles, channel
+    entities, video records and the uploads / comment snapshots. With
+    cached=False, responses and handles are not cached at all afterwards,
+    so every call pays its full upstream cost.
+    """
+    import main
+
+    if cached:
+        main._response_cache = main._ResponseCache(main.RESPONSE_CACHE_MAX_ENTRIES, main.RESPONSE_CACHE_MAX_BYTES)
+        main._handle_cache = main._HandleCache(None, main.HANDLE_CACHE_TTL, main.HANDLE_NEGATIVE_TTL)
+    else:
+        main._response_cache = main._ResponseCache(0, 0)
+        main._handle_cache = main._HandleCache(None, 0, 0)
+    main._channel_entities.clear()
+    main._videos.clear()
+    main._channel_videos.clear()
+    main._video_comments.clear()
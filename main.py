@@ -1,54 +1,1451 @@
 import re
 import os
+import atexit
+import html
+import json
+import logging
+import time
+import asyncio
 import statistics
+import threading
+import sqlite3
+import weakref
+import zlib
+import random
+import functools
+import contextvars
+import httpx
 import requests
 from pathlib import Path
-from collections import Counter
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from urllib.parse import urlparse
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from dotenv import load_dotenv
-from youtube_transcript_api import YouTubeTranscriptApi
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from youtube_transcript_api import IpBlocked, YouTubeTranscriptApi, YouTubeRequestFailed
 
 load_dotenv(dotenv_path=Path(__file__).parent / ".env")
 
+logger = logging.getLogger("youtube-mcp")
+
 API_KEY = os.environ.get("YOUTUBE_API_KEY", "")
+# Optional pool of keys from several Cloud projects; each carries its own daily quota.
+API_KEYS = [k.strip() for k in os.environ.get("YOUTUBE_API_KEYS", "").split(",") if k.strip()] or [API_KEY]
 BASE_URL = "https://www.googleapis.com/youtube/v3"
 
-def _get(endpoint: str, params: dict) -> dict:
-    """Thin wrapper around requests.get with shared API key and error handling."""
-    params["key"] = API_KEY
-    response = requests.get(f"{BASE_URL}/{endpoint}", params=params, timeout=10)
+HTTP_POOL_SIZE = int(os.environ.get("YOUTUBE_HTTP_POOL_SIZE", "10"))
+HTTP_KEEPALIVE = os.environ.get("YOUTUBE_HTTP_KEEPALIVE", "1") != "0"
+HTTP_MAX_CONNECTIONS = int(os.environ.get("YOUTUBE_HTTP_MAX_CONNECTIONS", "100"))
+HTTP_TIMEOUT = 10
+# Google APIs only gzip responses when the User-Agent also contains "gzip".
+HTTP_USER_AGENT = "youtube-mcp/2 (gzip)"
+
+# Retries for transient upstream failures (5xx, 429, rate-limit 403s, network errors).
+RETRY_MAX_ATTEMPTS = int(os.environ.get("YOUTUBE_RETRY_ATTEMPTS", "4"))
+RETRY_BASE_DELAY = float(os.environ.get("YOUTUBE_RETRY_BASE_DELAY", "0.5"))
+RETRY_MAX_DELAY = float(os.environ.get("YOUTUBE_RETRY_MAX_DELAY", "8"))
+# Retries one tool call may spend across all its upstream requests.
+RETRY_BUDGET = int(os.environ.get("YOUTUBE_RETRY_BUDGET", "8"))
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+# Consecutive failures that open an upstream's circuit, and how long it stays open.
+BREAKER_THRESHOLD = int(os.environ.get("YOUTUBE_BREAKER_THRESHOLD", "5"))
+BREAKER_COOLDOWN = float(os.environ.get("YOUTUBE_BREAKER_COOLDOWN", "30"))
+
+# Data API quota cost per list call, by endpoint.
+QUOTA_COSTS = {
+    "channels": 1,
+    "playlistItems": 1,
+    "videos": 1,
+    "commentThreads": 1,
+    "comments": 1,
+    "search": 100,
+}
+# Daily quota per API key; the process-wide budget scales with the size of the key pool.
+QUOTA_DAILY_LIMIT = int(os.environ.get("YOUTUBE_QUOTA_DAILY_LIMIT", "10000"))
+QUOTA_SOFT_LIMIT = int(os.environ.get("YOUTUBE_QUOTA_SOFT_LIMIT", str(QUOTA_DAILY_LIMIT * len(API_KEYS) * 8 // 10)))
+QUOTA_HARD_LIMIT = int(os.environ.get("YOUTUBE_QUOTA_HARD_LIMIT", str(QUOTA_DAILY_LIMIT * len(API_KEYS))))
+
+# Empty YOUTUBE_MCP_CACHE_DIR keeps every cache in memory only.
+_cache_dir_env = os.environ.get("YOUTUBE_MCP_CACHE_DIR", str(Path.home() / ".cache" / "youtube-mcp"))
+CACHE_DIR = Path(_cache_dir_env) if _cache_dir_env else None
+HANDLE_CACHE_TTL = int(os.environ.get("YOUTUBE_HANDLE_CACHE_TTL", str(30 * 86400)))
+HANDLE_NEGATIVE_TTL = int(os.environ.get("YOUTUBE_HANDLE_NEGATIVE_TTL", str(86400)))
+RESPONSE_CACHE_MAX_ENTRIES = int(os.environ.get("YOUTUBE_CACHE_MAX_ENTRIES", "2000"))
+RESPONSE_CACHE_MAX_BYTES = int(os.environ.get("YOUTUBE_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+PERSISTENT_CACHE = os.environ.get("YOUTUBE_PERSISTENT_CACHE", "0") == "1"
+ENTITY_TTL = int(os.environ.get("YOUTUBE_ENTITY_TTL", "3600"))
+COMPACTION_INTERVAL = int(os.environ.get("YOUTUBE_CACHE_COMPACTION_INTERVAL", "600"))
+FIELD_MASKS = os.environ.get("YOUTUBE_FIELD_MASKS", "1") != "0"
+# get_video_details_batch: input cap, and 50-ID videos.list calls in flight per tool call.
+VIDEO_BATCH_MAX_IDS = 5000
+VIDEO_BATCH_CONCURRENCY = int(os.environ.get("YOUTUBE_VIDEO_BATCH_CONCURRENCY", "4"))
+# Videos whose comments are paged at once across all channel-wide comment harvests.
+COMMENT_FANOUT_CONCURRENCY = int(os.environ.get("YOUTUBE_COMMENT_FANOUT_CONCURRENCY", "8"))
+# comments.list calls in flight per comment page when truncated reply threads are expanded.
+REPLY_FETCH_CONCURRENCY = int(os.environ.get("YOUTUBE_REPLY_FETCH_CONCURRENCY", "8"))
+
+# Partial-response masks (the `fields` parameter): each call site asks only
+# for what it reads, instead of whole parts with every thumbnail size,
+# localized blocks and so on.
+_THUMBNAIL_FIELDS = "thumbnails(maxres/url,standard/url,high/url,medium/url,default/url)"
+_VIDEO_STATS_FIELDS = "statistics(viewCount,likeCount,commentCount)"
+VIDEO_RECORD_FIELDS = (
+    f"items(id,snippet(title,channelTitle,description,tags,publishedAt,{_THUMBNAIL_FIELDS}),"
+    f"contentDetails/duration,{_VIDEO_STATS_FIELDS})"
+)
+# One channels.list shape serves overview, topics and the uploads playlist.
+CHANNEL_ENTITY_PARTS = "snippet,statistics,contentDetails,topicDetails"
+CHANNEL_ENTITY_FIELDS = (
+    f"items(id,snippet(title,description,publishedAt,{_THUMBNAIL_FIELDS}),"
+    "statistics(subscriberCount,viewCount,videoCount),"
+    "contentDetails/relatedPlaylists/uploads,topicDetails/topicCategories)"
+)
+# A comment resource as _normalize_comment reads it (thread top-level comment or reply).
+COMMENT_FIELDS = "id,snippet(authorDisplayName,textDisplay,likeCount,publishedAt)"
+
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+_sessions: dict = {}
+_sessions_lock = threading.Lock()
+_transport_stats: dict = {}
+_transport_stats_lock = threading.Lock()
+
+
+def _count_transport(host: str, key: str, amount: float = 1) -> None:
+    """Increment a per-host transport counter (requests, new connections, bytes, …)."""
+    with _transport_stats_lock:
+        host_stats = _transport_stats.setdefault(host, {
+            "requests": 0,
+            "connections": 0,
+            "bytes_wire": 0,
+            "bytes_decoded": 0,
+            "decompress_seconds": 0.0,
+        })
+        host_stats[key] += amount
+
+
+@dataclass
+class CallStats:
+    """Upstream traffic attributed to one tool call (see track_call)."""
+    tool: str
+    requests: int = 0
+    units: int = 0
+    cache_hits: int = 0
+    retries: int = 0
+    bytes_wire: int = 0
+    bytes_decoded: int = 0
+    decompress_seconds: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def add_units(self, units: int) -> None:
+        with self._lock:
+            self.units += units
+
+    def add_cache_hit(self) -> None:
+        with self._lock:
+            self.cache_hits += 1
+
+    def take_retry(self, budget: int) -> bool:
+        """Claim one retry from this call's budget; False once it is spent."""
+        with self._lock:
+            if self.retries >= budget:
+                return False
+            self.retries += 1
+            return True
+
+    def add_response(self, bytes_wire: int, bytes_decoded: int, decompress_seconds: float) -> None:
+        with self._lock:
+            self.requests += 1
+            self.bytes_wire += bytes_wire
+            self.bytes_decoded += bytes_decoded
+            self.decompress_seconds += decompress_seconds
+
+    def as_dict(self) -> dict:
+        return {
+            "quota_units": self.units,
+            "requests": self.requests,
+            "cache_hits": self.cache_hits,
+            "retries": self.retries,
+            "bytes_wire": self.bytes_wire,
+            "bytes_decoded": self.bytes_decoded,
+            "decompress_ms": _safe_float(self.decompress_seconds * 1000, 3),
+        }
+
+
+_call_stats: contextvars.ContextVar = contextvars.ContextVar("youtube_mcp_call_stats", default=None)
+_tool_totals: dict = {}
+_tool_totals_lock = threading.Lock()
+
+
+@contextmanager
+def track_call(tool: str):
+    """
+    Attribute all upstream traffic inside the block to `tool`.
+
+    Yields the CallStats for this call; on exit it is folded into the
+    per-tool totals returned by get_tool_stats(). Tasks spawned inside the
+    block inherit it through contextvars.
+    """
+    stats = CallStats(tool)
+    token = _call_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _call_stats.reset(token)
+        with _tool_totals_lock:
+            totals = _tool_totals.setdefault(tool, {
+                "calls": 0, "quota_units": 0, "requests": 0, "cache_hits": 0,
+                "bytes_wire": 0, "bytes_decoded": 0, "decompress_seconds": 0.0,
+            })
+            totals["calls"] += 1
+            totals["quota_units"] += stats.units
+            totals["requests"] += stats.requests
+            totals["cache_hits"] += stats.cache_hits
+            totals["bytes_wire"] += stats.bytes_wire
+            totals["bytes_decoded"] += stats.bytes_decoded
+            totals["decompress_seconds"] += stats.decompress_seconds
+
+
+def get_tool_stats() -> dict:
+    """
+    Per-tool totals: calls, quota units, upstream requests, cache hits,
+    bytes on the wire vs. decoded, decompression time.
+    """
+    with _tool_totals_lock:
+        snapshot = {tool: dict(totals) for tool, totals in _tool_totals.items()}
+    for totals in snapshot.values():
+        calls = totals["calls"] or 1
+        totals["avg_quota_units"] = _safe_float(totals["quota_units"] / calls, 2)
+        totals["avg_bytes_wire"] = _safe_float(totals["bytes_wire"] / calls, 0)
+        totals["decompress_ms"] = _safe_float(totals.pop("decompress_seconds") * 1000, 3)
+    return snapshot
+
+
+def _note_cache_hit() -> None:
+    """Count an upstream call avoided by any cache layer against the current tool call."""
+    stats = _call_stats.get()
+    if stats is not None:
+        stats.add_cache_hit()
+
+
+class QuotaExceededError(ValueError):
+    """Raised instead of calling the API once the daily hard limit would be crossed."""
+
+
+def _quota_day() -> str:
+    """Current quota day; the Data API quota resets at midnight Pacific time."""
+    try:
+        tz = ZoneInfo("America/Los_Angeles")
+    except ZoneInfoNotFoundError:
+        tz = timezone(timedelta(hours=-8))
+    return datetime.now(tz).date().isoformat()
+
+
+class _QuotaBudget:
+    """
+    Process-wide daily Data API quota ledger.
+
+    Every upstream Data API request is charged once, after a key has been
+    acquired and before it is sent (key rotation does not charge it again). Crossing
+    the soft limit logs a warning once per day; a request that would cross
+    the hard limit raises QuotaExceededError instead of being sent.
+    """
+
+    def __init__(self, daily_limit: int, soft_limit: int, hard_limit: int):
+        self.daily_limit = daily_limit
+        self.soft_limit = soft_limit
+        self.hard_limit = hard_limit
+        self._lock = threading.Lock()
+        self._reset(_quota_day())
+
+    def _reset(self, day: str) -> None:
+        self.day = day
+        self.spent = 0
+        self.requests = 0
+        self.by_endpoint: Counter = Counter()
+        self.soft_warned = False
+
+    def charge(self, endpoint: str) -> int:
+        cost = QUOTA_COSTS.get(endpoint, 1)
+        with self._lock:
+            today = _quota_day()
+            if today != self.day:
+                self._reset(today)
+            if self.spent + cost > self.hard_limit:
+                raise QuotaExceededError(
+                    f"Daily YouTube API quota budget exhausted ({self.spent}/{self.hard_limit} units "
+                    f"spent on {self.day}). It resets at midnight Pacific time."
+                )
+            self.spent += cost
+            self.requests += 1
+            self.by_endpoint[endpoint] += cost
+            crossed_soft = self.spent >= self.soft_limit and not self.soft_warned
+            if crossed_soft:
+                self.soft_warned = True
+        if crossed_soft:
+            logger.warning(f"YouTube API quota soft limit reached: {self.spent}/{self.daily_limit} units today")
+        stats = _call_stats.get()
+        if stats is not None:
+            stats.add_units(cost)
+        return cost
+
+    def status(self) -> dict:
+        with self._lock:
+            if _quota_day() != self.day:
+                self._reset(_quota_day())
+            if self.spent >= self.hard_limit:
+                state = "exhausted"
+            elif self.spent >= self.soft_limit:
+                state = "soft_limit_reached"
+            else:
+                state = "ok"
+            return {
+                "quota_day": self.day,
+                "status": state,
+                "units_spent": self.spent,
+                "units_remaining": max(self.hard_limit - self.spent, 0),
+                "daily_limit": self.daily_limit,
+                "soft_limit": self.soft_limit,
+                "hard_limit": self.hard_limit,
+                "requests": self.requests,
+                "units_by_endpoint": dict(self.by_endpoint),
+            }
+
+
+_quota = _QuotaBudget(QUOTA_DAILY_LIMIT * len(API_KEYS), QUOTA_SOFT_LIMIT, QUOTA_HARD_LIMIT)
+
+
+class _KeyPool:
+    """
+    API keys with per-key daily spend.
+
+    Each request goes to the key with the most budget left, so load spreads
+    evenly across projects. A key is skipped for the rest of the quota day
+    once its spend reaches the per-key limit or the API answers 403
+    quotaExceeded for it.
+    """
+
+    def __init__(self, keys: list, daily_limit: int):
+        self.keys = list(dict.fromkeys(keys))
+        self.daily_limit = daily_limit
+        self._lock = threading.Lock()
+        self._reset(_quota_day())
+
+    def _reset(self, day: str) -> None:
+        self.day = day
+        self.spent = {key: 0 for key in self.keys}
+        self.exhausted = set()
+
+    def _roll_day(self) -> None:
+        today = _quota_day()
+        if today != self.day:
+            self._reset(today)
+
+    def acquire(self, cost: int) -> str:
+        """Reserve `cost` units on the key with the most remaining budget."""
+        with self._lock:
+            self._roll_day()
+            live = [k for k in self.keys if k not in self.exhausted and self.spent[k] + cost <= self.daily_limit]
+            if not live:
+                raise QuotaExceededError(
+                    f"All {len(self.keys)} YouTube API key(s) are out of quota for {self.day}. "
+                    "Quota resets at midnight Pacific time."
+                )
+            key = min(live, key=lambda k: self.spent[k])
+            self.spent[key] += cost
+            return key
+
+    def release(self, key: str, cost: int) -> None:
+        """Give back units reserved by acquire for a request that was not served."""
+        with self._lock:
+            if key in self.spent:
+                self.spent[key] = max(self.spent[key] - cost, 0)
+
+    def mark_exhausted(self, key: str) -> None:
+        with self._lock:
+            self._roll_day()
+            self.exhausted.add(key)
+        logger.warning(f"YouTube API key ...{key[-4:]} reported quotaExceeded; routing around it until reset")
+
+    def status(self) -> list:
+        with self._lock:
+            self._roll_day()
+            return [
+                {
+                    "key": f"...{key[-4:]}" if key else "(unset)",
+                    "units_spent": self.spent[key],
+                    "units_remaining": 0 if key in self.exhausted else max(self.daily_limit - self.spent[key], 0),
+                    "exhausted": key in self.exhausted,
+                }
+                for key in self.keys
+            ]
+
+
+_key_pool = _KeyPool(API_KEYS, QUOTA_DAILY_LIMIT)
+
+
+def _error_reasons(response: httpx.Response) -> set:
+    """`reason` codes from a Google API error body."""
+    try:
+        errors = response.json().get("error", {}).get("errors", [])
+    except (ValueError, AttributeError):
+        return set()
+    return {e.get("reason") for e in errors if isinstance(e, dict)}
+
+
+def _is_quota_exceeded(response: httpx.Response) -> bool:
+    """True for the 403s that mean a key's daily quota is spent (not plain permission errors)."""
+    return response.status_code == 403 and bool(_error_reasons(response) & {"quotaExceeded", "dailyLimitExceeded"})
+
+
+def get_quota_status() -> dict:
+    """
+    Today's Data API spend against the budget, plus per-tool averages for
+    capacity planning (quota units, cache hits, bytes on the wire vs.
+    decoded, decompression time) and per-host transport counters
+    (connection reuse, compression).
+    """
+    status = _quota.status()
+    status["keys"] = _key_pool.status()
+    status["cost_table"] = dict(QUOTA_COSTS)
+    status["per_tool"] = {
+        tool: {
+            key: totals[key]
+            for key in ("calls", "avg_quota_units", "cache_hits", "avg_bytes_wire", "bytes_decoded", "decompress_ms")
+        }
+        for tool, totals in get_tool_stats().items()
+    }
+    status["transport"] = get_transport_stats()
+    return status
+
+
+def _record_response(host: str, bytes_wire: int, bytes_decoded: int, decompress_seconds: float) -> None:
+    _count_transport(host, "bytes_wire", bytes_wire)
+    _count_transport(host, "bytes_decoded", bytes_decoded)
+    _count_transport(host, "decompress_seconds", decompress_seconds)
+    stats = _call_stats.get()
+    if stats is not None:
+        stats.add_response(bytes_wire, bytes_decoded, decompress_seconds)
+
+
+def _record_requests_response(response: requests.Response, *args, **kwargs) -> None:
+    """requests response hook: wire vs. decoded size (urllib3 decompresses internally)."""
+    decoded = len(response.content)
+    _record_response(urlparse(response.url).hostname or "", response.raw.tell() or decoded, decoded, 0.0)
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    def _new_conn(self):
+        _count_transport(self.host, "connections")
+        return super()._new_conn()
+
+    def _make_request(self, *args, **kwargs):
+        _count_transport(self.host, "requests")
+        return super()._make_request(*args, **kwargs)
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    def _new_conn(self):
+        _count_transport(self.host, "connections")
+        return super()._new_conn()
+
+    def _make_request(self, *args, **kwargs):
+        _count_transport(self.host, "requests")
+        return super()._make_request(*args, **kwargs)
+
+
+class _PooledAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pools record requests vs. newly opened connections."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+
+def _session(name: str) -> requests.Session:
+    """
+    Return the shared, pooled requests.Session for a blocking upstream.
+
+    Only the transcript fetcher still needs one, since youtube-transcript-api
+    is requests-based. urllib3 pools are thread-safe, so the session is shared
+    by every worker thread.
+    """
+    session = _sessions.get(name)
+    if session is not None:
+        return session
+    with _sessions_lock:
+        session = _sessions.get(name)
+        if session is None:
+            session = requests.Session()
+            adapter = _PooledAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers["Connection"] = "keep-alive" if HTTP_KEEPALIVE else "close"
+            session.headers["Accept-Encoding"] = "gzip"
+            session.hooks["response"].append(_record_requests_response)
+            _sessions[name] = session
+    return session
+
+
+def _client() -> httpx.AsyncClient:
+    """
+    Return the pooled httpx.AsyncClient for the running event loop.
+
+    httpx clients are bound to the loop they were first used on, so the
+    MCP server loop and the background loop behind the sync wrappers each
+    get their own client and keep-alive pool.
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(
+            timeout=HTTP_TIMEOUT,
+            follow_redirects=True,
+            headers={"User-Agent": HTTP_USER_AGENT, "Accept-Encoding": "gzip"},
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_POOL_SIZE if HTTP_KEEPALIVE else 0,
+            ),
+        )
+        _clients[loop] = client
+    return client
+
+
+def _trace(host: str):
+    """httpcore trace hook counting requests and newly opened TCP connections for a host."""
+    async def hook(event: str, info: dict) -> None:
+        if event == "connection.connect_tcp.complete":
+            _count_transport(host, "connections")
+        elif event.endswith(".send_request_headers.started"):
+            _count_transport(host, "requests")
+    return hook
+
+
+def _decode_body(raw: bytes, encoding: str) -> bytes:
+    # HEAD, 204 and 304 responses may announce an encoding without a body.
+    if not raw:
+        return raw
+    if encoding == "gzip":
+        return zlib.decompress(raw, 16 + zlib.MAX_WBITS)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(raw)
+        except zlib.error:
+            return zlib.decompress(raw, -zlib.MAX_WBITS)
+    return raw
+
+
+async def _fetch(method: str, url: str, **kwargs) -> httpx.Response:
+    """
+    Issue a request on the pooled async client with transport accounting.
+
+    The body is read raw and decompressed here rather than by httpx, so
+    wire bytes, decoded bytes and decompression time can be recorded per
+    host and per tool call. The returned response carries the decoded body.
+    """
+    host = httpx.URL(url).host
+    client = _client()
+    request = client.build_request(method, url, extensions={"trace": _trace(host)}, **kwargs)
+    response = await client.send(request, stream=True)
+    try:
+        raw = b"".join([chunk async for chunk in response.aiter_raw()])
+    finally:
+        await response.aclose()
+
+    encoding = response.headers.get("Content-Encoding", "").strip().lower()
+    started = time.perf_counter()
+    body = _decode_body(raw, encoding)
+    decompress_seconds = time.perf_counter() - started if encoding else 0.0
+    _record_response(host, len(raw), len(body), decompress_seconds)
+
+    headers = [
+        (name, value) for name, value in response.headers.multi_items()
+        if name.lower() not in ("content-encoding", "content-length", "transfer-encoding")
+    ]
+    return httpx.Response(response.status_code, headers=headers, content=body, request=request)
+
+
+class UpstreamUnavailableError(ValueError):
+    """Raised without a request while an upstream's circuit breaker is open."""
+
+
+class _CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker for one upstream.
+
+    After `threshold` failures in a row the circuit opens and calls fail
+    fast for `cooldown` seconds. Then one probe request is let through
+    (half-open): success closes the circuit, failure re-opens it. A probe
+    that never reports back stops blocking others after another cooldown.
+    """
+
+    def __init__(self, name: str, threshold: int, cooldown: float):
+        self.name = name
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at = None
+        self.probing_since = None
+        self._lock = threading.Lock()
+
+    def before(self) -> None:
+        with self._lock:
+            if self.opened_at is None:
+                return
+            now = time.monotonic()
+            busy_until = self.opened_at + self.cooldown
+            if self.probing_since is not None:
+                busy_until = max(busy_until, self.probing_since + self.cooldown)
+            if now < busy_until:
+                raise UpstreamUnavailableError(
+                    f"Upstream '{self.name}' is unavailable after {self.failures} consecutive failures; "
+                    f"retry in {busy_until - now:.0f}s."
+                )
+            self.probing_since = now
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self.probing_since = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.threshold or self.probing_since is not None:
+                if self.opened_at is None or self.probing_since is not None:
+                    logger.warning(f"Circuit opened for upstream '{self.name}' after {self.failures} consecutive failures")
+                self.opened_at = time.monotonic()
+                self.probing_since = None
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    def status(self) -> dict:
+        with self._lock:
+            if self.opened_at is None:
+                state = "closed"
+            elif self.probing_since is not None:
+                state = "half_open"
+            else:
+                state = "open"
+            return {"state": state, "consecutive_failures": self.failures}
+
+
+_breakers = {
+    name: _CircuitBreaker(name, BREAKER_THRESHOLD, BREAKER_COOLDOWN)
+    for name in ("data_api", "thumbnail", "transcript")
+}
+
+
+def _is_retryable(response: httpx.Response) -> bool:
+    if response.status_code in RETRYABLE_STATUS:
+        return True
+    return response.status_code == 403 and bool(_error_reasons(response) & {"rateLimitExceeded", "userRateLimitExceeded"})
+
+
+def _retry_delay(attempt: int, response) -> float | None:
+    """
+    Seconds to wait before retry number `attempt`: the server's Retry-After
+    if it sent one, else exponential backoff with jitter. None means the
+    server asked for a longer wait than RETRY_MAX_DELAY, so don't retry.
+    """
+    retry_after = response.headers.get("Retry-After") if isinstance(response, httpx.Response) else None
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                delay = (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                delay = None
+        if delay is not None:
+            return max(delay, 0.0) if delay <= RETRY_MAX_DELAY else None
+    ceiling = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** (attempt - 1))
+    return ceiling / 2 + random.uniform(0, ceiling / 2)
+
+
+async def _with_retries(upstream: str, send, transient: tuple = (httpx.TransportError,), retry_if=None):
+    """
+    Await `send()` under the upstream's circuit breaker, retrying transient failures.
+
+    Retryable HTTP statuses and `transient` exceptions count as failures and
+    are retried up to RETRY_MAX_ATTEMPTS times, within the current tool
+    call's retry budget, and never once the circuit has opened. When
+    retries run out the last response is returned
+    (callers still raise_for_status) or the last exception re-raised.
+    A `transient` exception that fails the optional `retry_if(error)` check
+    is a final answer from a healthy upstream and is raised at once.
+    """
+    breaker = _breakers[upstream]
+    attempt = 0
+    while True:
+        breaker.before()
+        response = error = None
+        try:
+            response = await send()
+        except transient as e:
+            if retry_if is not None and not retry_if(e):
+                breaker.record_success()
+                raise
+            error = e
+        if error is None and not (isinstance(response, httpx.Response) and _is_retryable(response)):
+            breaker.record_success()
+            return response
+        breaker.record_failure()
+        attempt += 1
+        delay = _retry_delay(attempt, response)
+        stats = _call_stats.get()
+        if (
+            attempt >= RETRY_MAX_ATTEMPTS
+            or delay is None
+            or breaker.is_open
+            or (stats is not None and not stats.take_retry(RETRY_BUDGET))
+        ):
+            if error is not None:
+                raise error
+            return response
+        reason = f"HTTP {response.status_code}" if error is None else type(error).__name__
+        logger.info(f"Retrying {upstream} request ({reason}), attempt {attempt + 1} in {delay:.2f}s")
+        await asyncio.sleep(delay)
+
+
+def get_breaker_status() -> dict:
+    """Circuit state per upstream."""
+    return {name: breaker.status() for name, breaker in _breakers.items()}
+
+
+def get_transport_stats() -> dict:
+    """
+    Per-host request and connection counts with the connection reuse ratio,
+    plus bytes on the wire vs. decoded and time spent decompressing.
+    """
+    with _transport_stats_lock:
+        snapshot = {host: dict(counts) for host, counts in _transport_stats.items()}
+    for counts in snapshot.values():
+        reqs = counts["requests"]
+        counts["reused_connections"] = max(reqs - counts["connections"], 0)
+        counts["reuse_ratio"] = _safe_float(counts["reused_connections"] / reqs if reqs else 0)
+        decoded = counts["bytes_decoded"]
+        counts["compression_ratio"] = _safe_float(counts["bytes_wire"] / decoded if decoded else 0)
+        counts["decompress_ms"] = _safe_float(counts.pop("decompress_seconds") * 1000, 3)
+    return snapshot
+
+
+def _cache_ttl(endpoint: str, params: dict) -> int:
+    """
+    Seconds a Data API response may be served from cache (0 = never cache).
+
+    Identity data (handle lookups) barely changes and is kept for days;
+    counters and charts go stale in minutes.
+    """
+    if endpoint == "channels":
+        if "forHandle" in params:
+            return 7 * 86400
+        return 30 * 60
+    if endpoint == "videos":
+        if params.get("chart") == "mostPopular":
+            return 15 * 60
+        return 5 * 60
+    if endpoint == "playlistItems":
+        return 10 * 60
+    if endpoint in ("commentThreads", "comments"):
+        return 3 * 60
+    return 0
+
+
+def _cache_key(endpoint: str, params: dict) -> str:
+    """Endpoint plus canonicalized params; the API key is never part of the key."""
+    canonical = sorted((k, str(v)) for k, v in params.items() if k != "key")
+    return endpoint + "?" + "&".join(f"{k}={v}" for k, v in canonical)
+
+
+class _ResponseCache:
+    """
+    Thread-safe TTL + LRU cache of parsed Data API responses.
+
+    Bounded both by entry count and by the total size of the raw response
+    bodies. Cached dicts are shared between callers and must be treated as
+    read-only. Expired entries that carry an ETag stay (until LRU eviction)
+    so _get_async can revalidate them with If-None-Match.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.revalidations = 0
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.time():
+                if entry is not None and not entry[3]:
+                    self._drop(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def get_stale(self, key: str) -> tuple:
+        """Return (data, size, etag) for an expired entry that can be revalidated, else (None, 0, None)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not entry[3]:
+                return None, 0, None
+            return entry[1], entry[2], entry[3]
+
+    def put(self, key: str, data: dict, size: int, ttl: int, etag: str | None = None) -> None:
+        if ttl <= 0 or self.max_entries <= 0 or size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (time.time() + ttl, data, size, etag)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def revalidated(self, key: str, data: dict, size: int, ttl: int, etag: str) -> None:
+        """A 304 confirmed the cached body: store it again with a fresh TTL."""
+        self.put(key, data, size, ttl, etag)
+        with self._lock:
+            self.revalidations += 1
+
+    def _drop(self, key: str) -> None:
+        _, _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "revalidations": self.revalidations,
+            }
+
+
+_response_cache = _ResponseCache(RESPONSE_CACHE_MAX_ENTRIES, RESPONSE_CACHE_MAX_BYTES)
+
+
+class _SqliteStore:
+    """
+    Optional on-disk cache that survives server restarts (YOUTUBE_PERSISTENT_CACHE=1).
+
+    Holds raw API responses and normalized video/channel records, each with
+    an expiry timestamp. WAL mode lets several server processes read while
+    one writes; each thread gets its own connection. A daemon thread
+    periodically deletes expired rows and checkpoints the WAL; responses
+    with an ETag are kept for STALE_GRACE past expiry so they can still be
+    revalidated.
+    Everything here is best-effort: a storage error degrades to a cache miss.
+    """
+
+    SCHEMA_VERSION = 2
+    STALE_GRACE = 7 * 86400
+
+    def __init__(self, path: Path, compaction_interval: int):
+        self.path = path
+        self.compaction_interval = compaction_interval
+        self._local = threading.local()
+        self._init_lock = threading.Lock()
+        self._initialized = False
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._init_lock:
+                if not self._initialized:
+                    self._create_schema(conn)
+                    self._initialized = True
+                    if self.compaction_interval > 0:
+                        threading.Thread(target=self._compact_forever, name="youtube-mcp-compact", daemon=True).start()
+        return conn
+
+    def _create_schema(self, conn: sqlite3.Connection) -> None:
+        # Cache contents are disposable, so a schema change simply starts over.
+        if conn.execute("PRAGMA user_version").fetchone()[0] != self.SCHEMA_VERSION:
+            conn.execute("DROP TABLE IF EXISTS responses")
+            conn.execute("DROP TABLE IF EXISTS entities")
+            conn.execute(f"PRAGMA user_version={self.SCHEMA_VERSION}")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, body TEXT NOT NULL, size INTEGER NOT NULL, "
+            "etag TEXT, expires_at REAL NOT NULL)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS entities ("
+            "kind TEXT NOT NULL, entity_id TEXT NOT NULL, data TEXT NOT NULL, "
+            "fetched_at REAL NOT NULL, expires_at REAL NOT NULL, PRIMARY KEY (kind, entity_id))"
+        )
+
+    def get_response(self, key: str) -> tuple:
+        """
+        Return (data, size, etag, expires_at) for a stored response, else
+        (None, 0, None, 0). Expired rows are returned only if they carry an
+        ETag, for revalidation; callers compare expires_at to now.
+        """
+        try:
+            row = self._conn().execute(
+                "SELECT body, size, etag, expires_at FROM responses "
+                "WHERE key = ? AND (expires_at > ? OR etag IS NOT NULL)",
+                (key, time.time()),
+            ).fetchone()
+        except sqlite3.Error:
+            return None, 0, None, 0
+        if row is None:
+            return None, 0, None, 0
+        return json.loads(row[0]), row[1], row[2], row[3]
+
+    def put_response(self, key: str, data: dict, size: int, expires_at: float, etag: str | None = None) -> None:
+        try:
+            self._conn().execute(
+                "INSERT OR REPLACE INTO responses (key, body, size, etag, expires_at) VALUES (?, ?, ?, ?, ?)",
+                (key, json.dumps(data), size, etag, expires_at),
+            )
+        except sqlite3.Error:
+            pass
+
+    def touch_response(self, key: str, expires_at: float) -> None:
+        try:
+            self._conn().execute("UPDATE responses SET expires_at = ? WHERE key = ?", (expires_at, key))
+        except sqlite3.Error:
+            pass
+
+    def get_entity(self, kind: str, entity_id: str):
+        """Return a fresh normalized record, or None."""
+        return self.get_entities_fetched(kind, [entity_id]).get(entity_id, (None, 0))[0]
+
+    def get_entities_fetched(self, kind: str, entity_ids: list) -> dict:
+        """Return {entity_id: (record, fetched_at)} for the unexpired records among `entity_ids`."""
+        found = {}
+        try:
+            for i in range(0, len(entity_ids), 500):
+                chunk = entity_ids[i:i + 500]
+                rows = self._conn().execute(
+                    "SELECT entity_id, data, fetched_at FROM entities WHERE kind = ? AND expires_at > ? "
+                    f"AND entity_id IN ({','.join('?' * len(chunk))})",
+                    (kind, time.time(), *chunk),
+                ).fetchall()
+                found.update((row[0], (json.loads(row[1]), row[2])) for row in rows)
+        except sqlite3.Error:
+            pass
+        return found
+
+    def put_entity(self, kind: str, entity_id: str, data: dict, ttl: int) -> None:
+        self.put_entities(kind, {entity_id: data}, ttl)
+
+    def put_entities(self, kind: str, records: dict, ttl: int) -> None:
+        """Write {entity_id: record} in one transaction."""
+        now = time.time()
+        rows = [(kind, entity_id, json.dumps(data), now, now + ttl) for entity_id, data in records.items()]
+        conn = None
+        try:
+            conn = self._conn()
+            conn.execute("BEGIN")
+            conn.executemany(
+                "INSERT OR REPLACE INTO entities (kind, entity_id, data, fetched_at, expires_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.execute("COMMIT")
+        except sqlite3.Error:
+            if conn is not None and conn.in_transaction:
+                conn.execute("ROLLBACK")
+
+    def compact(self) -> None:
+        """Delete expired rows and fold the WAL back into the main database file."""
+        conn = self._conn()
+        now = time.time()
+        conn.execute(
+            "DELETE FROM responses WHERE (etag IS NULL AND expires_at <= ?) OR expires_at <= ?",
+            (now, now - self.STALE_GRACE),
+        )
+        conn.execute("DELETE FROM entities WHERE expires_at <= ?", (now,))
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def _compact_forever(self) -> None:
+        while True:
+            time.sleep(self.compaction_interval)
+            try:
+                self.compact()
+            except sqlite3.Error:
+                pass
+
+
+_store = (
+    _SqliteStore(CACHE_DIR / "cache.sqlite3", COMPACTION_INTERVAL)
+    if PERSISTENT_CACHE and CACHE_DIR else None
+)
+
+
+class _SingleFlight:
+    """
+    Collapse identical concurrent upstream work into one task.
+
+    The first caller for a key starts the work as a task; callers arriving
+    while it runs await the same task. Each waiter is shielded, so one
+    cancelled caller does not cancel the work for the others; the task is
+    cancelled only when its last waiter goes away. Flights are tracked per
+    event loop, like the httpx clients.
+    """
+
+    def __init__(self):
+        self._flights: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict]" = weakref.WeakKeyDictionary()
+        self.started = 0
+        self.shared = 0
+
+    async def do(self, key, factory):
+        loop = asyncio.get_running_loop()
+        flights = self._flights.setdefault(loop, {})
+        flight = flights.get(key)
+        if flight is None:
+            flight = {"task": loop.create_task(factory()), "waiters": 0}
+            flights[key] = flight
+            flight["task"].add_done_callback(lambda _, f=flight: self._forget(flights, key, f))
+            self.started += 1
+        else:
+            self.shared += 1
+            _note_cache_hit()
+        flight["waiters"] += 1
+        try:
+            return await asyncio.shield(flight["task"])
+        finally:
+            flight["waiters"] -= 1
+            if flight["waiters"] == 0 and not flight["task"].done():
+                self._forget(flights, key, flight)
+                flight["task"].cancel()
+
+    @staticmethod
+    def _forget(flights: dict, key, flight: dict) -> None:
+        if flights.get(key) is flight:
+            del flights[key]
+
+    def stats(self) -> dict:
+        return {"started": self.started, "shared": self.shared}
+
+
+_single_flight = _SingleFlight()
+
+
+def get_cache_stats() -> dict:
+    """Hit/miss/eviction counters and current size of the response cache."""
+    stats = _response_cache.stats()
+    stats["persistent"] = str(_store.path) if _store else None
+    stats["single_flight"] = _single_flight.stats()
+    return stats
+
+
+async def _send_data_api(endpoint: str, params: dict, headers: dict) -> httpx.Response:
+    """One Data API request: pick a key, charge quota once, move to the next key on quotaExceeded."""
+    cost = QUOTA_COSTS.get(endpoint, 1)
+    charged = False
+    while True:
+        api_key = _key_pool.acquire(cost)
+        if not charged:
+            try:
+                _quota.charge(endpoint)
+            except QuotaExceededError:
+                _key_pool.release(api_key, cost)
+                raise
+            charged = True
+        response = await _fetch("GET", f"{BASE_URL}/{endpoint}", params={**params, "key": api_key}, headers=headers)
+        if not _is_quota_exceeded(response):
+            return response
+        # The rejected request was not served, so its units do not count against that key.
+        _key_pool.release(api_key, cost)
+        _key_pool.mark_exhausted(api_key)
+
+
+async def _get_async(endpoint: str, params: dict, revalidate: bool = False) -> dict:
+    """
+    Thin wrapper around the pooled async client with shared API key and error handling.
+    A `fields` mask in params is sent as-is (plus the top-level etag, which
+    revalidation needs) unless YOUTUBE_FIELD_MASKS=0.
+    Responses are served from the TTL/LRU cache when a fresh copy exists; an
+    expired copy with an ETag is revalidated with If-None-Match, and a 304
+    counts as a cache hit that renews its TTL. Identical concurrent misses
+    share one upstream request. With `revalidate`, even a fresh copy is
+    checked upstream (a 304 if unchanged) for callers that must see changes
+    made within the TTL.
+    """
+    if "fields" in params:
+        params = dict(params)
+        if FIELD_MASKS:
+            params["fields"] += ",etag"
+        else:
+            del params["fields"]
+    ttl = _cache_ttl(endpoint, params)
+    key = _cache_key(endpoint, params)
+    if ttl and not revalidate:
+        cached = _response_cache.get(key)
+        if cached is not None:
+            _note_cache_hit()
+            return cached
+    return await _single_flight.do(
+        ("get", key, revalidate), functools.partial(_refresh_async, endpoint, params, key, ttl, revalidate)
+    )
+
+
+async def _refresh_async(endpoint: str, params: dict, key: str, ttl: int, revalidate: bool = False) -> dict:
+    """Cache-miss path of _get_async: persistent store, revalidation, then a full fetch."""
+    stale, stale_size, etag = None, 0, None
+    if ttl:
+        stale, stale_size, etag = _response_cache.get_stale(key)
+        if stale is None and _store:
+            stored, size, stored_etag, expires_at = await asyncio.to_thread(_store.get_response, key)
+            if stored is not None and expires_at > time.time() and not revalidate:
+                _response_cache.put(key, stored, size, int(expires_at - time.time()), stored_etag)
+                _note_cache_hit()
+                return stored
+            if stored is not None:
+                stale, stale_size, etag = stored, size, stored_etag
+
+    headers = {"If-None-Match": etag} if etag else {}
+    response = await _with_retries("data_api", functools.partial(_send_data_api, endpoint, params, headers))
+    if response.status_code == 304 and stale is not None:
+        _response_cache.revalidated(key, stale, stale_size, ttl, etag)
+        if _store:
+            await asyncio.to_thread(_store.touch_response, key, time.time() + ttl)
+        _note_cache_hit()
+        return stale
     response.raise_for_status()
-    return response.json()
+    data = response.json()
+    etag = response.headers.get("ETag") or data.get("etag")
+    _response_cache.put(key, data, len(response.content), ttl, etag)
+    if ttl and _store:
+        await asyncio.to_thread(_store.put_response, key, data, len(response.content), time.time() + ttl, etag)
+    return data
 
 
-def resolve_channel_id(channel_url: str) -> str:
+@dataclass(frozen=True)
+class ChannelRef:
     """
-    Resolve a YouTube channel URL to a canonical channel ID (UCxxxx).
+    A resolved channel: canonical ID plus its uploads playlist ID.
+
+    uploads_derived is True when the uploads ID was computed locally
+    (UC… -> UU…) rather than read from channels.list, so callers know to
+    fall back to a lookup if the derived playlist turns out not to exist.
+    """
+    channel_id: str
+    uploads_playlist_id: str
+    uploads_derived: bool = False
+
+
+class _HandleCache:
+    """
+    @handle -> ChannelRef map kept in memory and mirrored to a JSON file.
+
+    Handles almost never move, so entries live for HANDLE_CACHE_TTL. Unknown
+    handles are cached as None for HANDLE_NEGATIVE_TTL so repeated typos do
+    not cost a lookup each time. Keys are lowercased (handles are case-insensitive).
+
+    Inserts only mark the map dirty; the file is rewritten by flush(), which
+    runs FLUSH_DELAY seconds after the first unsaved insert, at the end of a
+    pre-resolution batch and at exit. A burst of lookups costs one write.
+    """
+
+    FLUSH_DELAY = 1.0
+
+    def __init__(self, path: Path | None, ttl: int, negative_ttl: int):
+        self.path = path
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._entries: dict | None = None
+        self._dirty = False
+        self._timer: threading.Timer | None = None
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+    def _load(self) -> dict:
+        if self._entries is None:
+            self._entries = {}
+            if self.path and self.path.exists():
+                try:
+                    self._entries = json.loads(self.path.read_text(encoding="utf-8"))
+                except (OSError, ValueError):
+                    self._entries = {}
+        return self._entries
+
+    def flush(self) -> None:
+        """Write the map to disk if it changed since the last write."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty or not self.path:
+                return
+            self._dirty = False
+            body = json.dumps(self._entries)
+        with self._write_lock:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self.path.with_suffix(".tmp")
+                tmp.write_text(body, encoding="utf-8")
+                os.replace(tmp, self.path)
+            except OSError:
+                pass
+
+    def get(self, handle: str) -> tuple:
+        """Return (hit, ChannelRef or None). A hit with None means 'known not to exist'."""
+        with self._lock:
+            entry = self._load().get(handle.lower())
+        if not entry or entry["expires_at"] < time.time():
+            return False, None
+        if entry["channel_id"] is None:
+            return True, None
+        return True, ChannelRef(entry["channel_id"], entry["uploads_playlist_id"], entry["uploads_derived"])
+
+    def put(self, handle: str, ref: ChannelRef | None) -> None:
+        entry = {
+            "channel_id": ref.channel_id if ref else None,
+            "uploads_playlist_id": ref.uploads_playlist_id if ref else None,
+            "uploads_derived": ref.uploads_derived if ref else False,
+            "expires_at": time.time() + (self.ttl if ref else self.negative_ttl),
+        }
+        with self._lock:
+            entries = self._load()
+            entries[handle.lower()] = entry
+            now = time.time()
+            for key in [k for k, v in entries.items() if v["expires_at"] < now]:
+                del entries[key]
+            self._dirty = True
+            if self.path and self._timer is None:
+                self._timer = threading.Timer(self.FLUSH_DELAY, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+
+_handle_cache = _HandleCache(
+    CACHE_DIR / "handles.json" if CACHE_DIR else None,
+    HANDLE_CACHE_TTL,
+    HANDLE_NEGATIVE_TTL,
+)
+atexit.register(_handle_cache.flush)
+
+
+class _RecordStore:
+    """
+    Thread-safe process-wide LRU of normalized records (videos, channel
+    entities) keyed by ID, each with the time it was fetched.
+
+    Every path that normalizes an API item puts the record here, so any
+    tool can answer from it while it is fresh. Callers get copies.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, max_age: float) -> dict | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.time() - entry[0] > max_age:
+                return None
+            self._entries.move_to_end(key)
+            return dict(entry[1])
+
+    def put(self, key: str, record: dict, fetched_at: float | None = None) -> None:
+        with self._lock:
+            self._entries[key] = (fetched_at or time.time(), dict(record))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+CHANNEL_ENTITY_LIMIT = 1024
+_channel_entities = _RecordStore(CHANNEL_ENTITY_LIMIT)
+_CHANNEL_OVERVIEW_KEYS = (
+    "channel_id", "title", "description", "subscriber_count",
+    "total_views", "total_videos", "created_at", "thumbnail_url",
+)
+
+
+def _remember_channel_entity(item: dict) -> dict:
+    """Normalize a channels.list item fetched with CHANNEL_ENTITY_FIELDS and keep it."""
+    snippet = item.get("snippet", {})
+    stats = item.get("statistics", {})
+    entity = {
+        "channel_id": item["id"],
+        "title": snippet.get("title", ""),
+        "description": snippet.get("description", ""),
+        "subscriber_count": _safe_int(stats.get("subscriberCount", 0)),
+        "total_views": _safe_int(stats.get("viewCount", 0)),
+        "total_videos": _safe_int(stats.get("videoCount", 0)),
+        "created_at": snippet.get("publishedAt", ""),
+        "thumbnail_url": _thumbnail_url(snippet.get("thumbnails", {})),
+        "uploads_playlist_id": item.get("contentDetails", {}).get("relatedPlaylists", {}).get("uploads", ""),
+        "topic_category_urls": item.get("topicDetails", {}).get("topicCategories", []),
+    }
+    _channel_entities.put(entity["channel_id"], entity)
+    return entity
+
+
+async def _persist_entities_async(kind: str, records: dict, ttl: int) -> None:
+    """Write records to the persistent store (if enabled) on a worker thread, off the event loop."""
+    if _store and records:
+        await asyncio.to_thread(_store.put_entities, kind, records, ttl)
+
+
+class _SnapshotStore:
+    """
+    Sync snapshots (a channel's uploads, a video's comments) kept in an
+    in-memory LRU and mirrored to the persistent store as entity `kind`.
+    """
+
+    def __init__(self, kind: str, max_entries: int, ttl: int = 7 * 86400):
+        self.kind = kind
+        self.ttl = ttl
+        self._records = _RecordStore(max_entries)
+
+    async def load(self, key: str) -> dict | None:
+        snapshot = self._records.get(key, float("inf"))
+        if snapshot is None and _store:
+            snapshot = await asyncio.to_thread(_store.get_entity, self.kind, key)
+            if snapshot is not None:
+                self._records.put(key, snapshot)
+        return snapshot
+
+    async def save(self, key: str, snapshot: dict) -> None:
+        self._records.put(key, snapshot)
+        await _persist_entities_async(self.kind, {key: snapshot}, self.ttl)
+
+    def clear(self) -> None:
+        self._records.clear()
+
+
+async def _get_channel_entities_async(channel_ids: list) -> dict:
+    """
+    Channel entities for any number of IDs: {channel_id: entity}.
+
+    Served from memory while fresh (the channels stats TTL), then from the
+    persistent store (for ENTITY_TTL) if enabled; the rest come from comma-joined
+    channels.list calls of up to 50 IDs that request every part once.
+    IDs the API does not return are absent.
+    """
+    fresh_for = _cache_ttl("channels", {"part": CHANNEL_ENTITY_PARTS})
+    unique_ids = list(dict.fromkeys(channel_ids))
+    entities = {}
+    for channel_id in unique_ids:
+        entity = _channel_entities.get(channel_id, fresh_for)
+        if entity is not None:
+            _note_cache_hit()
+            entities[channel_id] = entity
+    missing = [channel_id for channel_id in unique_ids if channel_id not in entities]
+    if _store and missing:
+        stored = await asyncio.to_thread(_store.get_entities_fetched, "channel_entity", missing)
+        for channel_id, (entity, fetched_at) in stored.items():
+            # Persisted entities answer for ENTITY_TTL, so a restarted server needs no call.
+            if time.time() - fetched_at < ENTITY_TTL:
+                _channel_entities.put(channel_id, entity, fetched_at)
+                _note_cache_hit()
+                entities[channel_id] = entity
+    pending = [channel_id for channel_id in dict.fromkeys(channel_ids) if channel_id not in entities]
+
+    responses = await asyncio.gather(*(
+        _get_async("channels", {
+            "part": CHANNEL_ENTITY_PARTS,
+            "id": ",".join(pending[i:i + 50]),
+            "fields": CHANNEL_ENTITY_FIELDS,
+        })
+        for i in range(0, len(pending), 50)
+    ))
+    fetched = {}
+    for data in responses:
+        for item in data.get("items", []):
+            fetched[item["id"]] = _remember_channel_entity(item)
+    await _persist_entities_async("channel_entity", fetched, ENTITY_TTL)
+    entities.update(fetched)
+    return entities
+
+
+async def _get_channel_entity_async(channel_id: str) -> dict:
+    entity = (await _get_channel_entities_async([channel_id])).get(channel_id)
+    if entity is None:
+        raise ValueError(f"No data returned for channel: {channel_id}")
+    return entity
+
+
+def _channel_overview(entity: dict) -> dict:
+    return {key: entity[key] for key in _CHANNEL_OVERVIEW_KEYS}
+
+
+async def resolve_channel_async(channel_url: str) -> ChannelRef:
+    """
+    Resolve a YouTube channel URL to a ChannelRef.
 
     Supported formats:
-      - https://www.youtube.com/@handle
-      - https://www.youtube.com/channel/UCxxxx
+      - https://www.youtube.com/@handle   (one channels.list call for the full channel entity)
+      - https://www.youtube.com/channel/UCxxxx   (no call; uploads ID derived locally)
     """
     parsed = urlparse(channel_url)
     path = parsed.path.rstrip("/")
 
     match = re.match(r"^/channel/(UC[\w-]+)$", path)
     if match:
-        return match.group(1)
+        channel_id = match.group(1)
+        return ChannelRef(channel_id, "UU" + channel_id[2:], uploads_derived=True)
 
     handle_match = re.match(r"^/@([\w.-]+)$", path)
     if handle_match:
         handle = handle_match.group(1)
-        data = _get("channels", {
-            "part": "id",
+        hit, ref = _handle_cache.get(handle)
+        if hit:
+            _note_cache_hit()
+            if ref is None:
+                raise ValueError(f"No channel found for handle: @{handle}")
+            return ref
+
+        # Fetch the whole entity while we are paying for the lookup anyway,
+        # so a follow-up overview/topics call on this channel is free.
+        data = await _get_async("channels", {
+            "part": CHANNEL_ENTITY_PARTS,
             "forHandle": handle,
             "maxResults": 1,
+            "fields": CHANNEL_ENTITY_FIELDS,
         })
         items = data.get("items", [])
         if not items:
+            _handle_cache.put(handle, None)
             raise ValueError(f"No channel found for handle: @{handle}")
-        return items[0]["id"]
+        item = items[0]
+        entity = _remember_channel_entity(item)
+        await _persist_entities_async("channel_entity", {entity["channel_id"]: entity}, ENTITY_TTL)
+        uploads = entity["uploads_playlist_id"]
+        if uploads:
+            ref = ChannelRef(item["id"], uploads)
+        else:
+            ref = ChannelRef(item["id"], "UU" + item["id"][2:], uploads_derived=True)
+        _handle_cache.put(handle, ref)
+        return ref
 
     raise ValueError(
         f"Unsupported channel URL format: {channel_url}. "
@@ -56,16 +1453,52 @@ def resolve_channel_id(channel_url: str) -> str:
     )
 
 
-def _get_uploads_playlist_id(channel_id: str) -> str:
+async def preresolve_channels_async(channel_urls: list) -> dict:
+    """
+    Resolve many channel URLs concurrently, warming the handle cache.
+
+    Returns {channel_url: ChannelRef or None}; unresolvable URLs (unknown
+    handle, unsupported format) map to None instead of raising, so one bad
+    handle does not sink the batch. Quota, open-circuit and HTTP errors are
+    re-raised: they say nothing about the channel.
+    """
+    unique_urls = list(dict.fromkeys(channel_urls))
+    results = await asyncio.gather(
+        *(resolve_channel_async(url) for url in unique_urls),
+        return_exceptions=True,
+    )
+    # One handles.json write for the whole batch.
+    await asyncio.to_thread(_handle_cache.flush)
+    resolved = {}
+    for url, result in zip(unique_urls, results):
+        if isinstance(result, (QuotaExceededError, UpstreamUnavailableError)):
+            raise result
+        if isinstance(result, ValueError):
+            resolved[url] = None
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            resolved[url] = result
+    return resolved
+
+
+async def resolve_channel_id_async(channel_url: str) -> str:
+    """
+    Resolve a YouTube channel URL to a canonical channel ID (UCxxxx).
+
+    Supported formats:
+      - https://www.youtube.com/@handle
+      - https://www.youtube.com/channel/UCxxxx
+    """
+    return (await resolve_channel_async(channel_url)).channel_id
+
+
+async def _get_uploads_playlist_id_async(channel_id: str) -> str:
     """Return the uploads playlist ID for a channel."""
-    data = _get("channels", {
-        "part": "contentDetails",
-        "id": channel_id,
-    })
-    items = data.get("items", [])
-    if not items:
+    entity = (await _get_channel_entities_async([channel_id])).get(channel_id)
+    if entity is None or not entity["uploads_playlist_id"]:
         raise ValueError(f"Channel not found: {channel_id}")
-    return items[0]["contentDetails"]["relatedPlaylists"]["uploads"]
+    return entity["uploads_playlist_id"]
 
 
 def _parse_duration(iso_duration: str) -> int:
@@ -101,184 +1534,595 @@ def _thumbnail_url(thumbnails: dict) -> str:
     return ""
 
 
-def _fetch_videos_for_channel(channel_url: str, limit: int = 50) -> list:
+def _normalize_video(item: dict) -> dict:
+    """Map a videos.list item fetched with VIDEO_RECORD_FIELDS to the shared video record."""
+    snippet = item.get("snippet", {})
+    content = item.get("contentDetails", {})
+    stats = item.get("statistics", {})
+    return {
+        "video_id": item["id"],
+        "title": snippet.get("title", ""),
+        "channel_title": snippet.get("channelTitle", ""),
+        "description": snippet.get("description", ""),
+        "tags": snippet.get("tags", []),
+        "published_at": snippet.get("publishedAt", ""),
+        "duration_seconds": _parse_duration(content.get("duration", "PT0S")),
+        "views": _safe_int(stats.get("viewCount", 0)),
+        "likes": _safe_int(stats.get("likeCount", 0)),
+        "comments": _safe_int(stats.get("commentCount", 0)),
+        "thumbnail_url": _thumbnail_url(snippet.get("thumbnails", {})),
+    }
+
+
+VIDEO_ENTITY_LIMIT = 5000
+_videos = _RecordStore(VIDEO_ENTITY_LIMIT)
+
+
+async def _get_video_records_async(video_ids: list, concurrency: int | None = None) -> dict:
     """
-    Shared internal fetch — returns full normalized video list including tags.
-    Used by multiple growth tools to avoid code duplication.
+    Normalized records for any number of IDs: {video_id: record}.
+
+    Records fetched less than the videos TTL ago come from the shared store,
+    then records younger than ENTITY_TTL from the persistent store if
+    enabled; the rest are fetched as 50-ID videos.list calls, at most
+    `concurrency` in flight (unbounded if None). IDs the API does not
+    return are absent.
     """
-    channel_id = resolve_channel_id(channel_url)
-    uploads_playlist_id = _get_uploads_playlist_id(channel_id)
+    fresh_for = _cache_ttl("videos", {})
+    unique_ids = list(dict.fromkeys(video_ids))
+    records = {}
+    for video_id in unique_ids:
+        record = _videos.get(video_id, fresh_for)
+        if record is not None:
+            _note_cache_hit()
+            records[video_id] = record
+    missing = [video_id for video_id in unique_ids if video_id not in records]
+    if _store and missing:
+        stored = await asyncio.to_thread(_store.get_entities_fetched, "video", missing)
+        for video_id, (record, fetched_at) in stored.items():
+            # Persisted records answer for ENTITY_TTL (so a restarted server
+            # needs no upstream call); the original fetch time is kept so the
+            # in-memory copy is not mistaken for a fresh fetch.
+            if time.time() - fetched_at < ENTITY_TTL:
+                _videos.put(video_id, record, fetched_at)
+                _note_cache_hit()
+                records[video_id] = record
+    pending = [video_id for video_id in dict.fromkeys(video_ids) if video_id not in records]
+
+    chunks = [pending[i:i + 50] for i in range(0, len(pending), 50)]
+    semaphore = asyncio.Semaphore(concurrency or max(len(chunks), 1))
+
+    async def _chunk(chunk: list) -> dict:
+        async with semaphore:
+            return await _get_async("videos", {
+                "part": "snippet,contentDetails,statistics",
+                "id": ",".join(chunk),
+                "fields": VIDEO_RECORD_FIELDS,
+            })
+
+    responses = await asyncio.gather(*(_chunk(chunk) for chunk in chunks))
+    fetched = {}
+    for data in responses:
+        for item in data.get("items", []):
+            record = _normalize_video(item)
+            _videos.put(record["video_id"], record)
+            fetched[record["video_id"]] = record
+    await _persist_entities_async("video", fetched, ENTITY_TTL)
+    records.update(fetched)
+    return records
+
+
+async def _get_video_record_async(video_id: str) -> dict:
+    record = (await _get_video_records_async([video_id])).get(video_id)
+    if record is None:
+        raise ValueError(f"No video found for ID: {video_id}")
+    return record
 
-    video_ids = []
+
+async def _hydrate_videos_async(video_ids: list) -> list:
+    """Records for any number of IDs, in the order given; missing IDs are dropped."""
+    records = await _get_video_records_async(video_ids)
+    return [records[video_id] for video_id in video_ids if video_id in records]
+
+
+async def _iter_upload_pages_async(channel: ChannelRef, limit: int):
+    """
+    Yield (video_ids, is_last_page) for a channel's uploads playlist, newest
+    first, until `limit` IDs have been produced or the playlist ends.
+    """
+    uploads_playlist_id = channel.uploads_playlist_id
+    fetched = 0
     next_page_token = None
 
-    while len(video_ids) < limit:
-        batch_size = min(50, limit - len(video_ids))
+    while fetched < limit:
+        batch_size = min(50, limit - fetched)
         params = {
             "part": "contentDetails",
             "playlistId": uploads_playlist_id,
             "maxResults": batch_size,
+            "fields": "nextPageToken,items/contentDetails/videoId",
         }
         if next_page_token:
             params["pageToken"] = next_page_token
 
-        data = _get("playlistItems", params)
-        for item in data.get("items", []):
-            vid_id = item.get("contentDetails", {}).get("videoId")
-            if vid_id:
-                video_ids.append(vid_id)
-
+        try:
+            data = await _get_async("playlistItems", params)
+        except httpx.HTTPStatusError as e:
+            # A locally derived UU… ID can be wrong for unusual channels;
+            # only then pay for the channels.list lookup.
+            if not (channel.uploads_derived and not next_page_token and e.response.status_code == 404):
+                raise
+            uploads_playlist_id = await _get_uploads_playlist_id_async(channel.channel_id)
+            params["playlistId"] = uploads_playlist_id
+            data = await _get_async("playlistItems", params)
+        page_ids = [
+            vid_id for item in data.get("items", [])
+            if (vid_id := item.get("contentDetails", {}).get("videoId"))
+        ]
+        fetched += len(page_ids)
         next_page_token = data.get("nextPageToken")
-        if not next_page_token or len(video_ids) >= limit:
+        yield page_ids, not next_page_token
+        if not next_page_token:
             break
 
-    if not video_ids:
-        return []
 
-    videos = []
-    for i in range(0, len(video_ids), 50):
-        batch = video_ids[i:i + 50]
-        data = _get("videos", {
-            "part": "snippet,contentDetails,statistics",
-            "id": ",".join(batch),
+async def _refresh_video_stats_async(records: dict) -> None:
+    """Refresh views/likes/comments in place for cached records, 50 IDs per videos.list call."""
+    video_ids = list(records)
+    responses = await asyncio.gather(*(
+        _get_async("videos", {
+            "part": "statistics",
+            "id": ",".join(video_ids[i:i + 50]),
+            "fields": f"items(id,{_VIDEO_STATS_FIELDS})",
         })
+        for i in range(0, len(video_ids), 50)
+    ))
+    seen = set()
+    for data in responses:
         for item in data.get("items", []):
-            snippet = item.get("snippet", {})
-            content = item.get("contentDetails", {})
             stats = item.get("statistics", {})
-            videos.append({
-                "video_id": item["id"],
-                "title": snippet.get("title", ""),
-                "description": snippet.get("description", ""),
-                "tags": snippet.get("tags", []),
-                "published_at": snippet.get("publishedAt", ""),
-                "duration_seconds": _parse_duration(content.get("duration", "PT0S")),
-                "views": _safe_int(stats.get("viewCount", 0)),
-                "likes": _safe_int(stats.get("likeCount", 0)),
-                "comments": _safe_int(stats.get("commentCount", 0)),
-                "thumbnail_url": _thumbnail_url(snippet.get("thumbnails", {})),
-            })
+            record = records.get(item["id"])
+            if record is not None:
+                seen.add(item["id"])
+                record["views"] = _safe_int(stats.get("viewCount", 0))
+                record["likes"] = _safe_int(stats.get("likeCount", 0))
+                record["comments"] = _safe_int(stats.get("commentCount", 0))
+                _videos.put(record["video_id"], record)
+    # Videos missing from the response were deleted or made private.
+    for video_id in set(records) - seen:
+        del records[video_id]
+
+
+async def _scan_channel_videos_async(channel: ChannelRef, limit: int) -> tuple:
+    """
+    Full uploads scan. Returns (videos, reached_end_of_playlist).
 
-    return videos
+    Pipelined: each playlistItems page starts its videos.list hydration as a
+    task right away while the next page token is followed, so a 200-video
+    scan costs roughly the page walk plus one hydration instead of both in series.
+    """
+    hydrations = []
+    complete = False
+    try:
+        async for page_ids, is_last in _iter_upload_pages_async(channel, limit):
+            if page_ids:
+                hydrations.append(asyncio.create_task(_hydrate_videos_async(page_ids)))
+            complete = is_last
+        batches = await asyncio.gather(*hydrations)
+    except BaseException:
+        for task in hydrations:
+            task.cancel()
+        raise
+    return [video for batch in batches for video in batch], complete
 
-def get_channel_overview(channel_url: str) -> dict:
-    """Return a flat overview of a public YouTube channel."""
-    channel_id = resolve_channel_id(channel_url)
 
-    data = _get("channels", {
-        "part": "snippet,statistics",
-        "id": channel_id,
-    })
+CHANNEL_SNAPSHOT_LIMIT = 256
+_channel_videos = _SnapshotStore("channel_videos", CHANNEL_SNAPSHOT_LIMIT)
 
-    items = data.get("items", [])
-    if not items:
-        raise ValueError(f"No data returned for channel: {channel_id}")
 
-    item = items[0]
-    snippet = item.get("snippet", {})
-    stats = item.get("statistics", {})
+async def _fetch_videos_for_channel_async(channel_url: str, limit: int = 50) -> list:
+    """
+    Shared internal fetch — returns full normalized video list including tags.
+    Used by multiple growth tools to avoid code duplication.
 
-    return {
-        "channel_id": channel_id,
-        "title": snippet.get("title", ""),
-        "description": snippet.get("description", ""),
-        "subscriber_count": _safe_int(stats.get("subscriberCount", 0)),
-        "total_views": _safe_int(stats.get("viewCount", 0)),
-        "total_videos": _safe_int(stats.get("videoCount", 0)),
-        "created_at": snippet.get("publishedAt", ""),
-        "thumbnail_url": _thumbnail_url(snippet.get("thumbnails", {})),
-    }
+    Incremental: each channel keeps a snapshot of the uploads it has seen.
+    A repeat call pages the uploads playlist only until it reaches a known
+    video, hydrates just the new ones, and refreshes statistics for the
+    cached set (50 IDs per call) once they are older than the videos TTL.
+    A full scan happens only when the snapshot is missing or too short.
+    Concurrent calls for the same channel share one sync.
+    """
+    channel = await resolve_channel_async(channel_url)
+    sync = functools.partial(_sync_channel_videos_async, channel, limit)
+    snapshot = await _single_flight.do(("channel_videos", channel.channel_id), sync)
+    if len(snapshot["video_ids"]) < limit and not snapshot["complete"]:
+        # Joined a sync for a shorter window; extend it now that it has landed.
+        snapshot = await _single_flight.do(("channel_videos", channel.channel_id), sync)
+    return [dict(snapshot["videos"][video_id]) for video_id in snapshot["video_ids"][:limit]]
+
+
+async def _sync_channel_videos_async(channel: ChannelRef, limit: int) -> dict:
+    """Bring the channel's uploads snapshot up to date for `limit` videos and save it."""
+    snapshot = await _channel_videos.load(channel.channel_id)
+
+    if snapshot is None or (len(snapshot["video_ids"]) < limit and not snapshot["complete"]):
+        videos, complete = await _scan_channel_videos_async(channel, limit)
+        snapshot = {
+            "video_ids": [v["video_id"] for v in videos],
+            "videos": {v["video_id"]: v for v in videos},
+            "complete": complete,
+            "stats_synced_at": time.time(),
+        }
+    else:
+        known = set(snapshot["video_ids"])
+        new_ids = []
+        reached_known = reached_end = False
+        pages = _iter_upload_pages_async(channel, limit)
+        try:
+            async for page_ids, is_last in pages:
+                reached_end = is_last
+                for video_id in page_ids:
+                    if video_id in known:
+                        reached_known = True
+                        break
+                    new_ids.append(video_id)
+                if reached_known:
+                    break
+        finally:
+            await pages.aclose()
+
+        if reached_known:
+            known_ids = snapshot["video_ids"]
+            records = dict(snapshot["videos"])
+            complete = snapshot["complete"]
+        else:
+            # Everything in the window is new: the old snapshot is out of range.
+            known_ids, records, complete = [], {}, reached_end
+
+        stats_synced_at = snapshot["stats_synced_at"]
+        stale = time.time() - stats_synced_at > _cache_ttl("videos", {})
+        if stale:
+            records = {video_id: dict(record) for video_id, record in records.items()}
+            stats_synced_at = time.time()
+        _, new_videos = await asyncio.gather(
+            _refresh_video_stats_async(records if stale else {}),
+            _hydrate_videos_async(new_ids),
+        )
+        records.update({v["video_id"]: v for v in new_videos})
 
-def get_channel_videos(channel_url: str, limit: int = 50) -> list:
+        window = max(limit, len(known_ids))
+        video_ids = [
+            video_id for video_id in [v["video_id"] for v in new_videos] + known_ids
+            if video_id in records
+        ]
+        snapshot = {
+            "video_ids": video_ids[:window],
+            "videos": {video_id: records[video_id] for video_id in video_ids[:window]},
+            "complete": complete and len(video_ids) <= window,
+            "stats_synced_at": stats_synced_at,
+        }
+
+    await _channel_videos.save(channel.channel_id, snapshot)
+    return snapshot
+
+async def get_channel_overview_async(channel_url: str) -> dict:
+    """Return a flat overview of a public YouTube channel."""
+    channel_id = await resolve_channel_id_async(channel_url)
+    return _channel_overview(await _get_channel_entity_async(channel_id))
+
+async def get_channel_videos_async(channel_url: str, limit: int = 50) -> list:
     """Return a list of recent public videos from a channel with per-video stats."""
-    videos = _fetch_videos_for_channel(channel_url, limit)
+    videos = await _fetch_videos_for_channel_async(channel_url, limit)
     return [
         {k: v for k, v in video.items() if k != "tags"}
         for video in videos
     ]
 
-def get_video_details(video_id: str) -> dict:
+async def get_video_details_async(video_id: str) -> dict:
     """Return detailed metadata for a single video, including tags."""
-    data = _get("videos", {
-        "part": "snippet,contentDetails,statistics",
-        "id": video_id,
-    })
+    return await _get_video_record_async(video_id)
 
-    items = data.get("items", [])
-    if not items:
-        raise ValueError(f"No video found for ID: {video_id}")
+async def get_video_details_batch_async(video_ids: list) -> dict:
+    """
+    Detailed metadata for many videos, in the order given.
 
-    item = items[0]
-    snippet = item.get("snippet", {})
-    content = item.get("contentDetails", {})
-    stats = item.get("statistics", {})
+    IDs are deduplicated; videos not in the shared store are fetched as
+    50-ID videos.list calls, at most VIDEO_BATCH_CONCURRENCY in flight. IDs
+    the API does not return (deleted, private or invalid) are listed under
+    missing_ids.
+    """
+    if not video_ids:
+        raise ValueError("video_ids must not be empty.")
+    unique_ids = list(dict.fromkeys(v.strip() for v in video_ids if v and v.strip()))
+    if len(unique_ids) > VIDEO_BATCH_MAX_IDS:
+        raise ValueError(f"At most {VIDEO_BATCH_MAX_IDS} unique video IDs per call (got {len(unique_ids)}).")
+
+    found = await _get_video_records_async(unique_ids, concurrency=VIDEO_BATCH_CONCURRENCY)
 
     return {
-        "video_id": video_id,
-        "title": snippet.get("title", ""),
-        "description": snippet.get("description", ""),
-        "tags": snippet.get("tags", []),
+        "requested_count": len(video_ids),
+        "unique_count": len(unique_ids),
+        "found_count": len(found),
+        "missing_ids": [video_id for video_id in unique_ids if video_id not in found],
+        "videos": [found[video_id] for video_id in unique_ids if video_id in found],
+    }
+
+def _normalize_comment(comment: dict) -> dict:
+    """Map a comment resource (a thread's topLevelComment or a reply) to a flat record."""
+    snippet = comment.get("snippet", {})
+    return {
+        "comment_id": comment.get("id", ""),
+        "author": snippet.get("authorDisplayName", ""),
+        "text": snippet.get("textDisplay", ""),
+        "like_count": _safe_int(snippet.get("likeCount", 0)),
         "published_at": snippet.get("publishedAt", ""),
-        "duration_seconds": _parse_duration(content.get("duration", "PT0S")),
-        "views": _safe_int(stats.get("viewCount", 0)),
-        "likes": _safe_int(stats.get("likeCount", 0)),
-        "comments": _safe_int(stats.get("commentCount", 0)),
-        "thumbnail_url": _thumbnail_url(snippet.get("thumbnails", {})),
     }
 
-def get_video_comments(video_id: str, limit: int = 100) -> dict:
-    """Return top-level comments for a video, sorted by relevance."""
-    video_data = _get("videos", {"part": "statistics", "id": video_id})
-    video_items = video_data.get("items", [])
-    total_count = 0
-    if video_items:
-        total_count = _safe_int(video_items[0].get("statistics", {}).get("commentCount", 0))
 
-    comments = []
-    next_page_token = None
+async def _get_replies_async(parent_id: str, limit: int) -> list:
+    """Page comments.list by parentId for up to `limit` normalized replies."""
+    replies = []
+    page_token = None
+    while len(replies) < limit:
+        params = {
+            "part": "snippet",
+            "parentId": parent_id,
+            "maxResults": min(100, limit - len(replies)),
+            "fields": f"nextPageToken,items({COMMENT_FIELDS})",
+        }
+        if page_token:
+            params["pageToken"] = page_token
+        data = await _get_async("comments", params)
+        replies.extend(_normalize_comment(item) for item in data.get("items", []))
+        page_token = data.get("nextPageToken")
+        if not page_token:
+            break
+    return replies[:limit]
+
+
+async def _expand_replies_async(threads: list, replies_per_thread: int) -> None:
+    """
+    Attach up to `replies_per_thread` replies to each thread's top-level comment.
 
-    while len(comments) < limit:
-        batch_size = min(100, limit - len(comments))
+    The inline `replies` part of commentThreads holds only a few replies per
+    thread. Where it already covers the thread (or the cap), it is used as
+    is; only truncated threads are paged through comments.list, at most
+    REPLY_FETCH_CONCURRENCY at a time.
+    """
+    semaphore = asyncio.Semaphore(REPLY_FETCH_CONCURRENCY)
+
+    async def _fetch(comment: dict) -> None:
+        async with semaphore:
+            comment["replies"] = await _get_replies_async(comment["comment_id"], replies_per_thread)
+
+    truncated = []
+    for item, comment in threads:
+        total = _safe_int(item.get("snippet", {}).get("totalReplyCount", 0))
+        inline = [_normalize_comment(reply) for reply in item.get("replies", {}).get("comments", [])]
+        comment["reply_count"] = total
+        comment["replies"] = inline[:replies_per_thread]
+        if len(inline) < min(total, replies_per_thread):
+            truncated.append(comment)
+    await asyncio.gather(*(_fetch(comment) for comment in truncated))
+
+
+async def _iter_comment_pages_async(
+    video_id: str,
+    limit: int,
+    order: str = "relevance",
+    prefetch: bool = True,
+    replies_per_thread: int = 0,
+    revalidate: bool = False,
+):
+    """
+    Yield pages (lists of normalized top-level comments) from commentThreads
+    until `limit` comments have been produced or the threads run out.
+
+    With `prefetch`, the next page is requested before the current one is
+    yielded, so whatever the consumer does with a page overlaps the next
+    round trip. Consumers that may stop early (incremental sync) turn it
+    off so they never pay for a page they will not read, and set
+    `revalidate` so cached pages cannot hide comments posted within the TTL.
+
+    A positive `replies_per_thread` also requests the inline replies part
+    and gives every comment `reply_count` and `replies` (see
+    _expand_replies_async); `limit` counts threads, not replies.
+    """
+    def _request(page_token, remaining):
         params = {
             "part": "snippet",
             "videoId": video_id,
-            "maxResults": batch_size,
-            "order": "relevance",
+            "maxResults": min(100, remaining),
+            "order": order,
+            "fields": f"nextPageToken,items/snippet/topLevelComment({COMMENT_FIELDS})",
         }
-        if next_page_token:
-            params["pageToken"] = next_page_token
+        if replies_per_thread:
+            params["part"] = "snippet,replies"
+            params["fields"] = (
+                f"nextPageToken,items(snippet(totalReplyCount,topLevelComment({COMMENT_FIELDS})),"
+                f"replies/comments({COMMENT_FIELDS}))"
+            )
+        if page_token:
+            params["pageToken"] = page_token
+        return asyncio.ensure_future(_get_async("commentThreads", params, revalidate=revalidate))
 
-        data = _get("commentThreads", params)
-        for item in data.get("items", []):
-            top = item.get("snippet", {}).get("topLevelComment", {})
-            s = top.get("snippet", {})
-            comments.append({
-                "author": s.get("authorDisplayName", ""),
-                "text": s.get("textDisplay", ""),
-                "like_count": _safe_int(s.get("likeCount", 0)),
-                "published_at": s.get("publishedAt", ""),
-            })
+    produced = 0
+    next_page_token = None
+    pending = _request(None, limit)
+    try:
+        while pending is not None:
+            data = await pending
+            pending = None
+            items = data.get("items", [])[:limit - produced]
+            page = [_normalize_comment(item.get("snippet", {}).get("topLevelComment", {})) for item in items]
+            produced += len(page)
+            next_page_token = data.get("nextPageToken")
+            more = bool(next_page_token) and produced < limit
+            if more and prefetch:
+                pending = _request(next_page_token, limit - produced)
+            if replies_per_thread:
+                await _expand_replies_async(list(zip(items, page)), replies_per_thread)
+            if page:
+                yield page
+            if more and not prefetch:
+                pending = _request(next_page_token, limit - produced)
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+COMMENT_SNAPSHOT_LIMIT = 256
+COMMENT_SNAPSHOT_MAX_COMMENTS = 10000
+_video_comments = _SnapshotStore("video_comments", COMMENT_SNAPSHOT_LIMIT)
+
+
+async def _sync_video_comments_async(video_id: str, limit: int) -> tuple:
+    """
+    Bring the video's newest-first comment snapshot up to date for `limit`
+    comments and save it. Returns (snapshot, new_comment_count).
+
+    Pages commentThreads with order=time only until a stored comment ID
+    shows up. Pages are revalidated even while cached, so a quiet video
+    costs one conditional request (a 304 if nothing changed). A full scan
+    happens only when there is no snapshot or it is too short. Like counts
+    of already stored comments are not refreshed.
+    """
+    snapshot = await _video_comments.load(video_id)
+    full_scan = snapshot is None or (len(snapshot["comments"]) < limit and not snapshot["complete"])
+    known = set() if full_scan else {c["comment_id"] for c in snapshot["comments"]}
 
-        next_page_token = data.get("nextPageToken")
-        if not next_page_token or len(comments) >= limit:
-            break
+    new_comments = []
+    reached_known = False
+    pages = _iter_comment_pages_async(video_id, limit, order="time", prefetch=full_scan, revalidate=True)
+    try:
+        async for page in pages:
+            for comment in page:
+                if comment["comment_id"] in known:
+                    reached_known = True
+                    break
+                new_comments.append(comment)
+            if reached_known:
+                break
+    finally:
+        await pages.aclose()
+
+    exhausted = not reached_known and len(new_comments) < limit
+    if full_scan or not reached_known:
+        # No snapshot, or everything in the window is new: start over.
+        comments, complete = new_comments, exhausted
+    else:
+        # Keep older comments up to the cap, but never fewer than this call needs.
+        window = max(limit, min(len(snapshot["comments"]), COMMENT_SNAPSHOT_MAX_COMMENTS))
+        merged = new_comments + snapshot["comments"]
+        comments, complete = merged[:window], snapshot["complete"] and len(merged) <= window
+
+    snapshot = {"comments": comments, "complete": complete, "synced_at": time.time()}
+    await _video_comments.save(video_id, snapshot)
+    return snapshot, len(new_comments)
+
+
+async def get_video_comments_async(
+    video_id: str,
+    limit: int = 100,
+    incremental: bool = False,
+    include_replies: bool = False,
+    replies_per_thread: int = 20,
+) -> dict:
+    """
+    Return top-level comments for a video, sorted by relevance.
+
+    With `incremental`, comments are newest first instead and come from a
+    per-video comment store that is synced with order=time, so repeated
+    monitoring of a video only downloads what is new since the last call.
+    With `include_replies`, each comment carries up to `replies_per_thread`
+    replies; comments.list is called only for threads whose inline replies
+    are truncated.
+    """
+    if include_replies and incremental:
+        raise ValueError("include_replies is not supported together with incremental.")
+    if include_replies and replies_per_thread < 1:
+        raise ValueError("replies_per_thread must be at least 1.")
+    video_data = await _get_async("videos", {
+        "part": "statistics",
+        "id": video_id,
+        "fields": "items/statistics/commentCount",
+    })
+    video_items = video_data.get("items", [])
+    total_count = 0
+    if video_items:
+        total_count = _safe_int(video_items[0].get("statistics", {}).get("commentCount", 0))
 
-    return {
+    if incremental:
+        sync = functools.partial(_sync_video_comments_async, video_id, limit)
+        snapshot, new_count = await _single_flight.do(("video_comments", video_id), sync)
+        if len(snapshot["comments"]) < limit and not snapshot["complete"]:
+            # Joined a sync for a shorter window; extend it now that it has landed.
+            snapshot, new_count = await _single_flight.do(("video_comments", video_id), sync)
+        comments = [dict(c) for c in snapshot["comments"][:limit]]
+        return {
+            "video_id": video_id,
+            "total_comment_count": total_count,
+            "returned_comment_count": len(comments),
+            "new_comment_count": new_count,
+            "comments": comments,
+        }
+
+    comments = []
+    pages = _iter_comment_pages_async(video_id, limit, replies_per_thread=replies_per_thread if include_replies else 0)
+    async for page in pages:
+        comments.extend(page)
+
+    result = {
         "video_id": video_id,
         "total_comment_count": total_count,
         "returned_comment_count": len(comments),
         "comments": comments,
     }
+    if include_replies:
+        result["returned_reply_count"] = sum(len(c["replies"]) for c in comments)
+    return result
 
-def get_video_transcript(video_id: str) -> dict:
+def _is_transient_transcript_error(error: Exception) -> bool:
+    """
+    Connection errors and 5xx are worth retrying; other HTTP errors from YouTube are final.
+
+    youtube-transcript-api reports a 429 as IpBlocked rather than
+    YouTubeRequestFailed. An IP block outlasts any retry backoff, so it is
+    final too, and as a deliberate answer it does not count against the breaker.
+    """
+    if isinstance(error, IpBlocked):
+        return False
+    if isinstance(error, YouTubeRequestFailed):
+        # The status is not kept on the exception: youtube-transcript-api 1.2
+        # raises it while handling the requests HTTPError, so it is read from
+        # __context__. tests/test_transcript_retries.py goes through the
+        # library's own raising path to catch a change in that behaviour.
+        response = getattr(error.__context__, "response", None)
+        return response is not None and response.status_code in RETRYABLE_STATUS
+    return True
+
+
+def _fetch_transcript_raw(video_id: str) -> list:
+    """Blocking transcript fetch; youtube-transcript-api is requests-based."""
+    ytt = YouTubeTranscriptApi(http_client=_session("transcript"))
+    return ytt.fetch(video_id).to_raw_data()
+
+
+async def get_video_transcript_async(video_id: str) -> dict:
     """
     Fetch the auto-generated or manual transcript for a video.
-    Uses youtube-transcript-api >= 1.0.0 instance-based API.
+    Uses youtube-transcript-api >= 1.0.0 instance-based API, run on the
+    loop's executor so it does not block other requests.
     """
     try:
-        ytt = YouTubeTranscriptApi()
-        fetched = ytt.fetch(video_id)
-        raw = fetched.to_raw_data()
+        loop = asyncio.get_running_loop()
+        ctx = contextvars.copy_context()
+        raw = await _with_retries(
+            "transcript",
+            lambda: loop.run_in_executor(None, functools.partial(ctx.run, _fetch_transcript_raw, video_id)),
+            transient=(requests.ConnectionError, requests.Timeout, YouTubeRequestFailed, IpBlocked),
+            retry_if=_is_transient_transcript_error,
+        )
     except Exception as e:
         error_msg = str(e)
         if "PoToken" in error_msg:
@@ -299,22 +2143,16 @@ def get_video_transcript(video_id: str) -> dict:
         "segment_count": len(raw),
     }
 
-def analyze_thumbnail(video_id: str) -> dict:
+async def analyze_thumbnail_async(video_id: str) -> dict:
     """Return basic image metadata for a video's thumbnail."""
-    data = _get("videos", {"part": "snippet", "id": video_id})
-    items = data.get("items", [])
-    if not items:
-        raise ValueError(f"No video found for ID: {video_id}")
-
-    thumbnails = items[0].get("snippet", {}).get("thumbnails", {})
-    thumbnail_url = _thumbnail_url(thumbnails)
+    thumbnail_url = (await _get_video_record_async(video_id))["thumbnail_url"]
     if not thumbnail_url:
         raise ValueError(f"No thumbnail URL found for video: {video_id}")
 
-    head_resp = requests.head(thumbnail_url, timeout=10)
+    head_resp = await _with_retries("thumbnail", functools.partial(_fetch, "HEAD", thumbnail_url))
     file_size_bytes = _safe_int(head_resp.headers.get("Content-Length", 0))
 
-    img_resp = requests.get(thumbnail_url, timeout=10)
+    img_resp = await _with_retries("thumbnail", functools.partial(_fetch, "GET", thumbnail_url))
     img_resp.raise_for_status()
 
     try:
@@ -336,7 +2174,7 @@ def analyze_thumbnail(video_id: str) -> dict:
         "file_size_bytes": file_size_bytes,
     }
 
-def get_trending_videos(region_code: str = "US", category_id: str = "0", limit: int = 25) -> list:
+async def get_trending_videos_async(region_code: str = "US", category_id: str = "0", limit: int = 25) -> list:
     """
     Return currently popular YouTube videos for a region and category.
 
@@ -353,56 +2191,41 @@ def get_trending_videos(region_code: str = "US", category_id: str = "0", limit:
         "chart": "mostPopular",
         "regionCode": region_code.upper(),
         "maxResults": min(limit, 50),
+        "fields": VIDEO_RECORD_FIELDS,
     }
     if category_id != "0":
         params["videoCategoryId"] = category_id
 
-    data = _get("videos", params)
+    data = await _get_async("videos", params)
     results = []
 
     for item in data.get("items", []):
-        snippet = item.get("snippet", {})
-        content = item.get("contentDetails", {})
-        stats = item.get("statistics", {})
-        results.append({
-            "video_id": item["id"],
-            "title": snippet.get("title", ""),
-            "channel_title": snippet.get("channelTitle", ""),
-            "published_at": snippet.get("publishedAt", ""),
-            "duration_seconds": _parse_duration(content.get("duration", "PT0S")),
-            "views": _safe_int(stats.get("viewCount", 0)),
-            "likes": _safe_int(stats.get("likeCount", 0)),
-            "comments": _safe_int(stats.get("commentCount", 0)),
-            "thumbnail_url": _thumbnail_url(snippet.get("thumbnails", {})),
-        })
+        record = _normalize_video(item)
+        _videos.put(record["video_id"], record)
+        results.append({key: record[key] for key in (
+            "video_id", "title", "channel_title", "published_at", "duration_seconds",
+            "views", "likes", "comments", "thumbnail_url",
+        )})
 
     return results
 
-def compare_videos(video_ids: list) -> dict:
+async def compare_videos_async(video_ids: list) -> dict:
     """Side-by-side stats comparison for up to 10 video IDs."""
     if not video_ids:
         raise ValueError("video_ids must not be empty.")
     video_ids = video_ids[:10]
 
-    data = _get("videos", {
-        "part": "snippet,contentDetails,statistics",
-        "id": ",".join(video_ids),
-    })
+    records = await _get_video_records_async(video_ids)
 
     videos = []
-    for item in data.get("items", []):
-        snippet = item.get("snippet", {})
-        content = item.get("contentDetails", {})
-        stats = item.get("statistics", {})
-        views = _safe_int(stats.get("viewCount", 0))
-        likes = _safe_int(stats.get("likeCount", 0))
-        comments = _safe_int(stats.get("commentCount", 0))
+    for record in (records[video_id] for video_id in dict.fromkeys(video_ids) if video_id in records):
+        views, likes, comments = record["views"], record["likes"], record["comments"]
         engagement_rate = _safe_float((likes + comments) / views * 100 if views > 0 else 0)
         videos.append({
-            "video_id": item["id"],
-            "title": snippet.get("title", ""),
-            "published_at": snippet.get("publishedAt", ""),
-            "duration_seconds": _parse_duration(content.get("duration", "PT0S")),
+            "video_id": record["video_id"],
+            "title": record["title"],
+            "published_at": record["published_at"],
+            "duration_seconds": record["duration_seconds"],
             "views": views,
             "likes": likes,
             "comments": comments,
@@ -422,7 +2245,7 @@ def compare_videos(video_ids: list) -> dict:
         "winner_by_engagement_rate": _winner("engagement_rate_pct"),
     }
 
-def get_channel_topics(channel_url: str) -> dict:
+async def get_channel_topics_async(channel_url: str) -> dict:
     """
     Return the topic categories YouTube has associated with a channel.
 
@@ -430,37 +2253,43 @@ def get_channel_topics(channel_url: str) -> dict:
     human-readable since Freebase was deprecated in 2017. Only topicCategories
     (Wikipedia URLs) are returned as they are actually meaningful.
     """
-    channel_id = resolve_channel_id(channel_url)
-
-    data = _get("channels", {
-        "part": "snippet,topicDetails",
-        "id": channel_id,
-    })
-
-    items = data.get("items", [])
-    if not items:
-        raise ValueError(f"No data returned for channel: {channel_id}")
-
-    item = items[0]
-    topic_details = item.get("topicDetails", {})
-    raw_categories = topic_details.get("topicCategories", [])
+    channel_id = await resolve_channel_id_async(channel_url)
+    entity = await _get_channel_entity_async(channel_id)
+    raw_categories = entity["topic_category_urls"]
 
     readable_topics = [url.split("/wiki/")[-1].replace("_", " ") for url in raw_categories]
 
     return {
         "channel_id": channel_id,
-        "title": item.get("snippet", {}).get("title", ""),
+        "title": entity["title"],
         "topics": readable_topics,
         "topic_category_urls": raw_categories,
     }
 
-def compare_channels(channel_urls: list) -> dict:
-    """Side-by-side overview comparison for up to 5 channels."""
+async def compare_channels_async(channel_urls: list) -> dict:
+    """
+    Side-by-side overview comparison for up to 50 channels.
+
+    Handles are resolved concurrently (or from the handle cache), then every
+    channel not already known is hydrated by a single channels.list call.
+    URLs that cannot be resolved are reported instead of failing the whole
+    comparison.
+    """
     if not channel_urls:
         raise ValueError("channel_urls must not be empty.")
-    channel_urls = channel_urls[:5]
-
-    channels = [get_channel_overview(url) for url in channel_urls]
+    channel_urls = list(dict.fromkeys(channel_urls))[:50]
+
+    refs = await preresolve_channels_async(channel_urls)
+    entities = await _get_channel_entities_async([ref.channel_id for ref in refs.values() if ref])
+    channels, unresolved = [], []
+    for url in channel_urls:
+        ref = refs.get(url)
+        if ref is None or ref.channel_id not in entities:
+            unresolved.append(url)
+        else:
+            channels.append(_channel_overview(entities[ref.channel_id]))
+    if not channels:
+        raise ValueError(f"None of the channel URLs could be resolved: {unresolved}")
 
     def _winner(key):
         if not channels:
@@ -472,9 +2301,10 @@ def compare_channels(channel_urls: list) -> dict:
         "winner_by_subscribers": _winner("subscriber_count"),
         "winner_by_total_views": _winner("total_views"),
         "winner_by_video_count": _winner("total_videos"),
+        "unresolved_urls": unresolved,
     }
 
-def get_top_videos(channel_url: str, metric: str = "views", limit: int = 10) -> list:
+async def get_top_videos_async(channel_url: str, metric: str = "views", limit: int = 10) -> list:
     """
     Return a channel's top performing videos sorted by a given metric.
     metric options: views | likes | comments | engagement_rate
@@ -483,7 +2313,7 @@ def get_top_videos(channel_url: str, metric: str = "views", limit: int = 10) ->
     if metric not in valid_metrics:
         raise ValueError(f"metric must be one of: {valid_metrics}")
 
-    videos = _fetch_videos_for_channel(channel_url, limit=200)
+    videos = await _fetch_videos_for_channel_async(channel_url, limit=200)
 
     for v in videos:
         views = v["views"]
@@ -509,12 +2339,12 @@ def get_top_videos(channel_url: str, metric: str = "views", limit: int = 10) ->
         for idx, v in enumerate(sorted_videos)
     ]
 
-def get_upload_schedule(channel_url: str, limit: int = 50) -> dict:
+async def get_upload_schedule_async(channel_url: str, limit: int = 50) -> dict:
     """
     Analyze upload patterns: posting frequency by day/hour,
     average gap between uploads, and consistency score.
     """
-    videos = _fetch_videos_for_channel(channel_url, limit=limit)
+    videos = await _fetch_videos_for_channel_async(channel_url, limit=limit)
     if not videos:
         raise ValueError("No videos found for this channel.")
 
@@ -564,12 +2394,12 @@ def get_upload_schedule(channel_url: str, limit: int = 50) -> dict:
         "best_posting_hour": f"{best_hour}:00 UTC" if best_hour else "",
     }
 
-def get_tag_analysis(channel_url: str, limit: int = 50) -> dict:
+async def get_tag_analysis_async(channel_url: str, limit: int = 50) -> dict:
     """
     Aggregate tags across a channel's videos and correlate with performance.
     Returns top tags by frequency and by average views.
     """
-    videos = _fetch_videos_for_channel(channel_url, limit=limit)
+    videos = await _fetch_videos_for_channel_async(channel_url, limit=limit)
     if not videos:
         raise ValueError("No videos found for this channel.")
 
@@ -605,25 +2435,16 @@ def get_tag_analysis(channel_url: str, limit: int = 50) -> dict:
         "top_tags_by_avg_views": sorted(tag_stats, key=lambda x: x["avg_views"], reverse=True)[:20],
     }
 
-def get_video_seo_score(video_id: str) -> dict:
+async def get_video_seo_score_async(video_id: str) -> dict:
     """
     Check a video's metadata against YouTube SEO best practices.
     Scores each dimension 0-100 and returns an overall score.
     """
-    data = _get("videos", {
-        "part": "snippet,contentDetails,statistics",
-        "id": video_id,
-    })
-    items = data.get("items", [])
-    if not items:
-        raise ValueError(f"No video found for ID: {video_id}")
-
-    item = items[0]
-    snippet = item.get("snippet", {})
-    title = snippet.get("title", "")
-    description = snippet.get("description", "")
-    tags = snippet.get("tags", [])
-    thumbnail = _thumbnail_url(snippet.get("thumbnails", {}))
+    record = await _get_video_record_async(video_id)
+    title = record["title"]
+    description = record["description"]
+    tags = record["tags"]
+    thumbnail = record["thumbnail_url"]
 
     checks = {}
 
@@ -688,12 +2509,12 @@ def get_video_seo_score(video_id: str) -> dict:
     }
 
 
-def get_engagement_stats(channel_url: str, limit: int = 50) -> dict:
+async def get_engagement_stats_async(channel_url: str, limit: int = 50) -> dict:
     """
     Compute per-video engagement metrics across a channel's recent videos.
     Returns averages, rates, and the top engaging video.
     """
-    videos = _fetch_videos_for_channel(channel_url, limit=limit)
+    videos = await _fetch_videos_for_channel_async(channel_url, limit=limit)
     if not videos:
         raise ValueError("No videos found for this channel.")
 
@@ -741,32 +2562,299 @@ def get_engagement_stats(channel_url: str, limit: int = 50) -> dict:
         "videos": enriched,
     }
 
-def get_comment_keywords(video_id: str, limit: int = 200, top_n: int = 30) -> dict:
+# NLTK's English stopword list (179 words), bundled so keyword extraction
+# never needs a corpus download and gives the same counts on every machine.
+_BUNDLED_STOPWORDS = frozenset("""
+i me my myself we our ours ourselves you you're you've you'll you'd your yours
+yourself yourselves he him his himself she she's her hers herself it it's its
+itself they them their theirs themselves what which who whom this that that'll
+these those am is are was were be been being have has had having do does did
+doing a an the and but if or because as until while of at by for with about
+against between into through during before after above below to from up down
+in out on off over under again further then once here there when where why how
+all any both each few more most other some such no nor not only own same so
+than too very s t can will just don don't should should've now d ll m o re ve
+y ain aren aren't couldn couldn't didn didn't doesn doesn't hadn hadn't hasn
+hasn't haven haven't isn isn't ma mightn mightn't mustn mustn't needn needn't
+shan shan't shouldn shouldn't wasn wasn't weren weren't won won't wouldn
+wouldn't
+""".split())
+
+
+class _KeywordAnalyzer:
     """
-    Extract most frequent meaningful words from a video's comments.
-    Deterministic — no LLM, no sentiment model. Pure word frequency.
-    Uses NLTK's stopwords corpus (179 English stopwords) for filtering.
+    Stopword-filtered word counts for comment text.
+
+    Keeps the same words as the old word_tokenize pipeline (alphabetic
+    tokens of 3+ chars, not stopwords): clitics like n't / 's are split
+    off and Treebank's split words (gonna -> gon na) are reproduced, but
+    with one compiled regex instead of a Punkt + Treebank pass.
+
+    Input is the API's HTML textDisplay, so tags are dropped and entities
+    unescaped first. A single . or - joins a token (well-known, e.g) as in
+    Treebank, while runs of them (wow...amazing, great--video) separate
+    words.
     """
-    import nltk
-    nltk.download("stopwords", quiet=True)
-    nltk.download("punkt_tab", quiet=True)
-    from nltk.corpus import stopwords as nltk_stopwords
-    from nltk.tokenize import word_tokenize
-    STOPWORDS = set(nltk_stopwords.words("english"))
 
-    comment_data = get_video_comments(video_id, limit=limit)
-    all_text = " ".join(c["text"] for c in comment_data["comments"])
+    _MARKUP_RE = re.compile(r"<[^>]*>")
+    _TOKEN_RE = re.compile(r"[\w'’]+(?:[.-][\w'’]+)*\.?")
+    _CLITIC_RE = re.compile(r"(?:n['’]t|['’](?:s|re|ve|ll|d|m))$")
+    _SPLIT_WORDS = {
+        "cannot": ("can", "not"), "gimme": ("gim", "me"), "gonna": ("gon", "na"),
+        "gotta": ("got", "ta"), "lemme": ("lem", "me"), "wanna": ("wan", "na"),
+    }
+
+    def __init__(self, stopwords: frozenset):
+        self.stopwords = stopwords
+
+    def words(self, text: str):
+        """Yield the keyword candidates in `text`, in order."""
+        stopwords = self.stopwords
+        text = html.unescape(self._MARKUP_RE.sub(" ", text))
+        for token in self._TOKEN_RE.findall(text.lower()):
+            if not token.isalpha():
+                token = self._CLITIC_RE.sub("", token.strip("'’-").rstrip("."))
+            for word in self._SPLIT_WORDS.get(token, (token,)):
+                if len(word) >= 3 and word.isalpha() and word not in stopwords:
+                    yield word
+
+    def count(self, texts) -> Counter:
+        counter = Counter()
+        for text in texts:
+            counter.update(self.words(text))
+        return counter
+
 
-    # word_tokenize handles contractions, punctuation, and edge cases correctly
-    tokens = word_tokenize(all_text.lower())
-    filtered = [w for w in tokens if w.isalpha() and len(w) >= 3 and w not in STOPWORDS]
-    counter = Counter(filtered)
+_keyword_analyzer = _KeywordAnalyzer(_BUNDLED_STOPWORDS)
+
+
+async def get_comment_keywords_async(video_id: str, limit: int = 200, top_n: int = 30) -> dict:
+    """
+    Extract most frequent meaningful words from a video's comments.
+    Deterministic — no LLM, no sentiment model. Pure word frequency.
+    Filters NLTK's English stopwords (179 words, bundled). Comments are counted page
+    by page as they arrive, so memory stays flat as `limit` grows.
+    """
+    counter = Counter()
+    analyzed = 0
+    async for page in _iter_comment_pages_async(video_id, limit):
+        counter.update(_keyword_analyzer.count(c["text"] for c in page))
+        analyzed += len(page)
 
     return {
         "video_id": video_id,
-        "comments_analyzed": comment_data["returned_comment_count"],
+        "comments_analyzed": analyzed,
         "top_keywords": [
             {"word": word, "count": count}
             for word, count in counter.most_common(top_n)
         ],
-    }
\ No newline at end of file
+    }
+
+
+_comment_fanout: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+
+def _comment_fanout_semaphore() -> asyncio.Semaphore:
+    """Process-wide (per event loop) cap on videos being paged for comments at once."""
+    loop = asyncio.get_running_loop()
+    semaphore = _comment_fanout.get(loop)
+    if semaphore is None:
+        semaphore = _comment_fanout[loop] = asyncio.Semaphore(COMMENT_FANOUT_CONCURRENCY)
+    return semaphore
+
+
+async def get_channel_comment_keywords_async(
+    channel_url: str, video_count: int = 20, comments_per_video: int = 100, top_n: int = 30
+) -> dict:
+    """
+    Keyword frequencies across the comments of a channel's recent uploads.
+
+    Each video's comment pages are streamed and counted concurrently, with at
+    most COMMENT_FANOUT_CONCURRENCY videos in flight process-wide. Returns the
+    merged top keywords plus a per-video breakdown; videos whose comments
+    cannot be read (e.g. disabled) are reported rather than failing the call.
+    """
+    videos = await _fetch_videos_for_channel_async(channel_url, limit=video_count)
+    semaphore = _comment_fanout_semaphore()
+
+    async def _video(video: dict) -> dict:
+        counter = Counter()
+        analyzed = 0
+        async with semaphore:
+            try:
+                async for page in _iter_comment_pages_async(video["video_id"], comments_per_video):
+                    counter.update(_keyword_analyzer.count(c["text"] for c in page))
+                    analyzed += len(page)
+            except httpx.HTTPStatusError as e:
+                return {
+                    "video_id": video["video_id"],
+                    "title": video["title"],
+                    "error": f"comments unavailable (HTTP {e.response.status_code})",
+                    "counter": Counter(),
+                }
+        return {
+            "video_id": video["video_id"],
+            "title": video["title"],
+            "comments_analyzed": analyzed,
+            "counter": counter,
+        }
+
+    results = await asyncio.gather(*(_video(video) for video in videos))
+
+    merged = Counter()
+    per_video = []
+    for result in results:
+        counter = result.pop("counter")
+        merged.update(counter)
+        if "error" not in result:
+            result["top_keywords"] = [{"word": w, "count": c} for w, c in counter.most_common(10)]
+        per_video.append(result)
+
+    return {
+        "channel_url": channel_url,
+        "videos_analyzed": sum(1 for r in per_video if "error" not in r),
+        "comments_analyzed": sum(r.get("comments_analyzed", 0) for r in per_video),
+        "top_keywords": [{"word": w, "count": c} for w, c in merged.most_common(top_n)],
+        "videos": per_video,
+    }
+
+
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """Start (once) and return the daemon event loop that backs the sync wrappers."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="youtube-mcp-sync", daemon=True).start()
+    return _loop
+
+
+def _run(coro):
+    """
+    Run a coroutine on the background loop and block until it returns.
+
+    Works from plain scripts and from threads that have their own running
+    loop (Jupyter cells, asyncio.run); that loop is blocked for the call,
+    as the old requests-based functions did. Only a call made on the
+    background loop's own thread would deadlock, so that one raises.
+    """
+    loop = _background_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coro.close()
+        raise RuntimeError("Sync API called from the background loop; await the *_async variant instead.")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+# Synchronous API — thin wrappers over the coroutines above, kept so existing
+# `import main` callers work unchanged.
+
+def _get(endpoint: str, params: dict) -> dict:
+    return _run(_get_async(endpoint, params))
+
+
+def resolve_channel(channel_url: str) -> ChannelRef:
+    return _run(resolve_channel_async(channel_url))
+
+
+def preresolve_channels(channel_urls: list) -> dict:
+    return _run(preresolve_channels_async(channel_urls))
+
+
+def resolve_channel_id(channel_url: str) -> str:
+    return _run(resolve_channel_id_async(channel_url))
+
+
+def _get_uploads_playlist_id(channel_id: str) -> str:
+    return _run(_get_uploads_playlist_id_async(channel_id))
+
+
+def _fetch_videos_for_channel(channel_url: str, limit: int = 50) -> list:
+    return _run(_fetch_videos_for_channel_async(channel_url, limit))
+
+
+def get_channel_overview(channel_url: str) -> dict:
+    return _run(get_channel_overview_async(channel_url))
+
+
+def get_channel_videos(channel_url: str, limit: int = 50) -> list:
+    return _run(get_channel_videos_async(channel_url, limit))
+
+
+def get_video_details(video_id: str) -> dict:
+    return _run(get_video_details_async(video_id))
+
+
+def get_video_details_batch(video_ids: list) -> dict:
+    return _run(get_video_details_batch_async(video_ids))
+
+
+def get_video_comments(
+    video_id: str,
+    limit: int = 100,
+    incremental: bool = False,
+    include_replies: bool = False,
+    replies_per_thread: int = 20,
+) -> dict:
+    return _run(get_video_comments_async(video_id, limit, incremental, include_replies, replies_per_thread))
+
+
+def get_video_transcript(video_id: str) -> dict:
+    return _run(get_video_transcript_async(video_id))
+
+
+def analyze_thumbnail(video_id: str) -> dict:
+    return _run(analyze_thumbnail_async(video_id))
+
+
+def get_trending_videos(region_code: str = "US", category_id: str = "0", limit: int = 25) -> list:
+    return _run(get_trending_videos_async(region_code, category_id, limit))
+
+
+def compare_videos(video_ids: list) -> dict:
+    return _run(compare_videos_async(video_ids))
+
+
+def get_channel_topics(channel_url: str) -> dict:
+    return _run(get_channel_topics_async(channel_url))
+
+
+def compare_channels(channel_urls: list) -> dict:
+    return _run(compare_channels_async(channel_urls))
+
+
+def get_top_videos(channel_url: str, metric: str = "views", limit: int = 10) -> list:
+    return _run(get_top_videos_async(channel_url, metric, limit))
+
+
+def get_upload_schedule(channel_url: str, limit: int = 50) -> dict:
+    return _run(get_upload_schedule_async(channel_url, limit))
+
+
+def get_tag_analysis(channel_url: str, limit: int = 50) -> dict:
+    return _run(get_tag_analysis_async(channel_url, limit))
+
+
+def get_video_seo_score(video_id: str) -> dict:
+    return _run(get_video_seo_score_async(video_id))
+
+
+def get_engagement_stats(channel_url: str, limit: int = 50) -> dict:
+    return _run(get_engagement_stats_async(channel_url, limit))
+
+
+def get_comment_keywords(video_id: str, limit: int = 200, top_n: int = 30) -> dict:
+    return _run(get_comment_keywords_async(video_id, limit, top_n))
+
+
+def get_channel_comment_keywords(
+    channel_url: str, video_count: int = 20, comments_per_video: int = 100, top_n: int = 30
+) -> dict:
+    return _run(get_channel_comment_keywords_async(channel_url, video_count, comments_per_video, top_n))
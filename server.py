@@ -3,8 +3,11 @@ server.py — YouTube MCP Server
 All MCP protocol logic, tool registration, and schema definitions live here.
 """
 
+import os
 import json
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import (
@@ -19,10 +22,51 @@ import main
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("youtube-mcp")
+# httpx logs every request URL at INFO, API key included.
+logging.getLogger("httpx").setLevel(logging.WARNING)
 
 
 app = Server("youtube-mcp")
 
+
+def _parse_tool_limits(raw: str) -> dict:
+    """Parse "tool=n,tool=n" into a {tool: n} dict, ignoring malformed entries."""
+    limits = {}
+    for entry in raw.split(","):
+        tool, _, value = entry.partition("=")
+        if tool.strip() and value.strip().isdigit():
+            limits[tool.strip()] = max(int(value), 1)
+    return limits
+
+
+# Worker threads for the blocking calls left (transcript fetches);
+# also the default per-tool concurrency ceiling.
+WORKER_POOL_SIZE = int(os.environ.get("YOUTUBE_MCP_WORKERS", "8"))
+
+# Heavy multi-page tools get a lower ceiling so they cannot hog the upstream
+# connection pool and starve quick single-request tools like get_video_details.
+TOOL_CONCURRENCY: dict = {
+    "get_comment_keywords": 2,
+    "get_channel_comment_keywords": 2,
+    "get_top_videos": 3,
+    "get_tag_analysis": 3,
+    "get_engagement_stats": 3,
+    "get_upload_schedule": 3,
+    "get_video_transcript": 2,
+    "analyze_thumbnail": 4,
+    **_parse_tool_limits(os.environ.get("YOUTUBE_MCP_TOOL_CONCURRENCY", "")),
+}
+
+_executor = ThreadPoolExecutor(max_workers=WORKER_POOL_SIZE, thread_name_prefix="youtube-mcp")
+_tool_semaphores: dict[str, asyncio.Semaphore] = {}
+
+
+def _tool_semaphore(name: str) -> asyncio.Semaphore:
+    """Per-tool concurrency limiter; tools without an explicit limit share the worker pool size."""
+    if name not in _tool_semaphores:
+        _tool_semaphores[name] = asyncio.Semaphore(TOOL_CONCURRENCY.get(name, WORKER_POOL_SIZE))
+    return _tool_semaphores[name]
+
 TOOLS: list[Tool] = [
 
 
@@ -90,12 +134,37 @@ TOOLS: list[Tool] = [
         },
     ),
 
+    Tool(
+        name="get_video_details_batch",
+        description=(
+            "Returns full metadata, including tags, for many videos in one call (up to 5000 IDs). "
+            "Duplicates are ignored; videos come back in input order, and IDs that are deleted, "
+            "private or invalid are listed in missing_ids. Prefer this over calling get_video_details in a loop."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "video_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "List of YouTube video IDs (max 5000).",
+                    "minItems": 1,
+                    "maxItems": 5000,
+                }
+            },
+            "required": ["video_ids"],
+        },
+    ),
+
     Tool(
         name="get_video_comments",
         description=(
             "Returns top-level comments for a video, sorted by relevance. "
             "Includes author, comment text, like count, and publish date. "
-            "Useful for audience sentiment and feedback analysis."
+            "Useful for audience sentiment and feedback analysis. "
+            "Set incremental to monitor a video: comments come newest first and "
+            "only those posted since the previous call are downloaded. "
+            "Set include_replies to attach each thread's replies (not with incremental)."
         ),
         inputSchema={
             "type": "object",
@@ -111,6 +180,26 @@ TOOLS: list[Tool] = [
                     "minimum": 1,
                     "maximum": 500,
                 },
+                "incremental": {
+                    "type": "boolean",
+                    "description": (
+                        "Return the newest comments from a stored snapshot that is synced "
+                        "with only the pages posted since the last call. Defaults to false."
+                    ),
+                    "default": False,
+                },
+                "include_replies": {
+                    "type": "boolean",
+                    "description": "Attach replies to each comment, with its total reply count. Defaults to false.",
+                    "default": False,
+                },
+                "replies_per_thread": {
+                    "type": "integer",
+                    "description": "Maximum replies attached per comment when include_replies is set. Defaults to 20.",
+                    "default": 20,
+                    "minimum": 1,
+                    "maximum": 500,
+                },
             },
             "required": ["video_id"],
         },
@@ -232,9 +321,10 @@ TOOLS: list[Tool] = [
     Tool(
         name="compare_channels",
         description=(
-            "Side-by-side overview comparison for multiple channels (max 5). "
+            "Side-by-side overview comparison for multiple channels (max 50). "
             "Returns subscriber count, total views, and video count for each, "
-            "plus declares winners in each category. Good for competitor analysis."
+            "plus declares winners in each category. URLs that cannot be resolved are listed in unresolved_urls. "
+            "Good for competitor analysis."
         ),
         inputSchema={
             "type": "object",
@@ -242,9 +332,9 @@ TOOLS: list[Tool] = [
                 "channel_urls": {
                     "type": "array",
                     "items": {"type": "string"},
-                    "description": "List of YouTube channel URLs to compare (max 5).",
+                    "description": "List of YouTube channel URLs to compare (max 50).",
                     "minItems": 2,
-                    "maxItems": 5,
+                    "maxItems": 50,
                 }
             },
             "required": ["channel_urls"],
@@ -401,7 +491,7 @@ TOOLS: list[Tool] = [
                     "description": "Number of comments to fetch for analysis. Defaults to 200.",
                     "default": 200,
                     "minimum": 10,
-                    "maximum": 500,
+                    "maximum": 10000,
                 },
                 "top_n": {
                     "type": "integer",
@@ -415,6 +505,62 @@ TOOLS: list[Tool] = [
         },
     ),
 
+    Tool(
+        name="get_channel_comment_keywords",
+        description=(
+            "Most frequent meaningful words across the comments of a channel's recent uploads, "
+            "plus the top keywords for each video. Videos are fetched concurrently. "
+            "Videos with comments disabled are reported, not fatal. Use this instead of looping "
+            "get_comment_keywords over a channel's videos."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "channel_url": {
+                    "type": "string",
+                    "description": "YouTube channel URL. Supported formats: https://www.youtube.com/@handle or https://www.youtube.com/channel/UCxxxx",
+                },
+                "video_count": {
+                    "type": "integer",
+                    "description": "Number of recent uploads to analyze. Defaults to 20.",
+                    "default": 20,
+                    "minimum": 1,
+                    "maximum": 50,
+                },
+                "comments_per_video": {
+                    "type": "integer",
+                    "description": "Comments to analyze per video. Defaults to 100.",
+                    "default": 100,
+                    "minimum": 10,
+                    "maximum": 1000,
+                },
+                "top_n": {
+                    "type": "integer",
+                    "description": "Number of top keywords to return. Defaults to 30.",
+                    "default": 30,
+                    "minimum": 5,
+                    "maximum": 100,
+                },
+            },
+            "required": ["channel_url"],
+        },
+    ),
+
+    Tool(
+        name="get_quota_status",
+        description=(
+            "Reports today's YouTube Data API quota spend against the configured daily budget. "
+            "Includes units by endpoint, soft/hard limits, each tool's average quota cost, payload size "
+            "and decompression time, "
+            "and per-host connection reuse and compression counters. "
+            "Makes no API calls and costs no quota."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {},
+        },
+    ),
+
 ]
 
 
@@ -427,121 +573,153 @@ async def list_tools() -> ListToolsResult:
 @app.call_tool()
 async def call_tool(name: str, arguments: dict) -> CallToolResult:
     """
-    Route incoming tool calls to the correct function in main.py.
+    Route incoming tool calls to the correct coroutine in main.py.
+    Tools await non-blocking HTTP on this loop, so concurrent calls overlap.
     Returns normalized JSON. All errors surfaced cleanly without crashing.
     """
     logger.info(f"Tool called: {name} | Arguments: {arguments}")
 
+    stats = None
     try:
-        result = _dispatch(name, arguments)
+        async with _tool_semaphore(name):
+            with main.track_call(name) as stats:
+                result = await _dispatch(name, arguments)
+        logger.info(
+            f"Tool finished: {name} | {stats.units} quota units, "
+            f"{stats.requests} upstream requests, {stats.cache_hits} cache hits, "
+            f"{stats.bytes_wire} bytes on wire ({stats.bytes_decoded} decoded), "
+            f"{stats.decompress_seconds * 1000:.2f} ms decompressing"
+        )
         return CallToolResult(
             content=[TextContent(type="text", text=json.dumps(result, ensure_ascii=False, indent=2))],
             isError=False,
+            _meta=stats.as_dict(),
         )
     except ValueError as e:
         logger.warning(f"ValueError in tool '{name}': {e}")
         return CallToolResult(
             content=[TextContent(type="text", text=json.dumps({"error": str(e)}))],
             isError=True,
+            _meta=stats.as_dict() if stats else None,
         )
     except Exception as e:
         logger.error(f"Unexpected error in tool '{name}': {e}", exc_info=True)
         return CallToolResult(
             content=[TextContent(type="text", text=json.dumps({"error": f"Internal server error: {str(e)}"}) )],
             isError=True,
+            _meta=stats.as_dict() if stats else None,
         )
 
 
-def _dispatch(name: str, args: dict):
+async def _dispatch(name: str, args: dict):
     """
-    Pure dispatch table — maps tool names to main.py functions.
+    Pure dispatch table — maps tool names to main.py coroutines.
     No business logic here.
     """
     match name:
 
         
         case "get_channel_overview":
-            return main.get_channel_overview(channel_url=args["channel_url"])
+            return await main.get_channel_overview_async(channel_url=args["channel_url"])
 
         case "get_channel_videos":
-            return main.get_channel_videos(
+            return await main.get_channel_videos_async(
                 channel_url=args["channel_url"],
                 limit=args.get("limit", 50),
             )
 
         case "get_video_details":
-            return main.get_video_details(video_id=args["video_id"])
+            return await main.get_video_details_async(video_id=args["video_id"])
+
+        case "get_video_details_batch":
+            return await main.get_video_details_batch_async(video_ids=args["video_ids"])
 
         case "get_video_comments":
-            return main.get_video_comments(
+            return await main.get_video_comments_async(
                 video_id=args["video_id"],
                 limit=args.get("limit", 100),
+                incremental=args.get("incremental", False),
+                include_replies=args.get("include_replies", False),
+                replies_per_thread=args.get("replies_per_thread", 20),
             )
 
         case "get_video_transcript":
-            return main.get_video_transcript(video_id=args["video_id"])
+            return await main.get_video_transcript_async(video_id=args["video_id"])
 
         case "analyze_thumbnail":
-            return main.analyze_thumbnail(video_id=args["video_id"])
+            return await main.analyze_thumbnail_async(video_id=args["video_id"])
 
         
         case "get_trending_videos":
-            return main.get_trending_videos(
+            return await main.get_trending_videos_async(
                 region_code=args.get("region_code", "US"),
                 category_id=args.get("category_id", "0"),
                 limit=args.get("limit", 25),
             )
 
         case "compare_videos":
-            return main.compare_videos(video_ids=args["video_ids"])
+            return await main.compare_videos_async(video_ids=args["video_ids"])
 
         case "get_channel_topics":
-            return main.get_channel_topics(channel_url=args["channel_url"])
+            return await main.get_channel_topics_async(channel_url=args["channel_url"])
 
         case "compare_channels":
-            return main.compare_channels(channel_urls=args["channel_urls"])
+            return await main.compare_channels_async(channel_urls=args["channel_urls"])
 
         case "get_top_videos":
-            return main.get_top_videos(
+            return await main.get_top_videos_async(
                 channel_url=args["channel_url"],
                 metric=args.get("metric", "views"),
                 limit=args.get("limit", 10),
             )
 
         case "get_upload_schedule":
-            return main.get_upload_schedule(
+            return await main.get_upload_schedule_async(
                 channel_url=args["channel_url"],
                 limit=args.get("limit", 50),
             )
 
         case "get_tag_analysis":
-            return main.get_tag_analysis(
+            return await main.get_tag_analysis_async(
                 channel_url=args["channel_url"],
                 limit=args.get("limit", 50),
             )
 
         case "get_video_seo_score":
-            return main.get_video_seo_score(video_id=args["video_id"])
+            return await main.get_video_seo_score_async(video_id=args["video_id"])
 
         case "get_engagement_stats":
-            return main.get_engagement_stats(
+            return await main.get_engagement_stats_async(
                 channel_url=args["channel_url"],
                 limit=args.get("limit", 50),
             )
 
         case "get_comment_keywords":
-            return main.get_comment_keywords(
+            return await main.get_comment_keywords_async(
                 video_id=args["video_id"],
                 limit=args.get("limit", 200),
                 top_n=args.get("top_n", 30),
             )
 
+        case "get_channel_comment_keywords":
+            return await main.get_channel_comment_keywords_async(
+                channel_url=args["channel_url"],
+                video_count=args.get("video_count", 20),
+                comments_per_video=args.get("comments_per_video", 100),
+                top_n=args.get("top_n", 30),
+            )
+
+        case "get_quota_status":
+            return main.get_quota_status()
+
         case _:
             raise ValueError(f"Unknown tool: '{name}'")
 
 async def run():
     """Start the MCP server over stdio."""
-    logger.info("Starting youtube-mcp server (v2 — 16 tools)...")
+    logger.info("Starting youtube-mcp server (v2 — 19 tools)...")
+    # Blocking leftovers (transcript fetches) run on the bounded worker pool.
+    asyncio.get_running_loop().set_default_executor(_executor)
     async with stdio_server() as (read_stream, write_stream):
         await app.run(
             read_stream,
@@ -551,5 +729,4 @@ async def run():
 
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(run())
\ No newline at end of file
@@ -0,0 +1,22 @@
+"""Shared fixtures: the local fake Data API from benchmarks/fake_youtube.py."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "benchmarks"))
+
+import fake_youtube  # noqa: E402
+import main  # noqa: E402
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    """A fresh fake API, with main pointed at it and every in-process cache empty."""
+    monkeypatch.setattr(main, "BASE_URL", main.BASE_URL)
+    server = fake_youtube.connect(latency=0.0)
+    fake_youtube.reset_caches()
+    yield server
+    server.shutdown()
+    fake_youtube.reset_caches()
@@ -0,0 +1,90 @@
+"""Incremental uploads sync (_sync_channel_videos_async) against the fake Data API."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import fake_youtube  # noqa: E402
+import main  # noqa: E402
+
+CHANNEL = main.ChannelRef(fake_youtube.CHANNEL_ID, fake_youtube.UPLOADS_ID)
+
+
+@pytest.fixture(autouse=True)
+def uncached(fake, monkeypatch):
+    # Playlist changes must be visible right away, not after the response TTL.
+    monkeypatch.setattr(main, "_response_cache", main._ResponseCache(0, 0))
+
+
+def _sync(limit: int) -> dict:
+    return main._run(main._sync_channel_videos_async(CHANNEL, limit))
+
+
+def _ids(*numbers) -> list:
+    return [f"vid{n:08d}" for n in numbers]
+
+
+def test_new_uploads_cost_one_page_and_one_hydration(fake):
+    _sync(10)
+    fake.uploads[:0] = [901, 900]
+    before = fake.request_count
+
+    snapshot = _sync(10)
+
+    assert fake.request_count - before == 2
+    assert snapshot["video_ids"][:3] == _ids(901, 900, 0)
+    assert snapshot["videos"]["vid00000901"]["video_id"] == "vid00000901"
+
+
+def test_window_keeps_the_newest_videos(fake):
+    _sync(10)
+    fake.uploads[:0] = [902, 901, 900]
+
+    snapshot = _sync(10)
+
+    assert snapshot["video_ids"] == _ids(902, 901, 900, *range(7))
+    assert set(snapshot["videos"]) == set(snapshot["video_ids"])
+    assert not snapshot["complete"]
+
+
+def test_stats_refresh_drops_deleted_videos(fake):
+    _sync(10)
+    stale = main._run(main._channel_videos.load(fake_youtube.CHANNEL_ID))
+    stale["stats_synced_at"] = 0
+    main._run(main._channel_videos.save(fake_youtube.CHANNEL_ID, stale))
+    fake.uploads.remove(3)
+    fake.deleted.add(3)
+
+    snapshot = _sync(10)
+
+    assert snapshot["video_ids"] == _ids(0, 1, 2, *range(4, 10))
+    assert "vid00000003" not in snapshot["videos"]
+    assert snapshot["stats_synced_at"] > 0
+
+
+def test_complete_flag_follows_the_playlist_end(fake):
+    fake.uploads[:] = range(5)
+    assert _sync(10)["complete"]
+
+    fake.uploads.insert(0, 100)
+    snapshot = _sync(10)
+    assert snapshot["complete"] and len(snapshot["video_ids"]) == 6
+
+    fake.uploads[:0] = range(105, 100, -1)
+    snapshot = _sync(10)
+    assert snapshot["video_ids"] == _ids(*range(105, 99, -1), *range(4))
+    assert not snapshot["complete"]
+
+
+def test_all_new_window_replaces_the_snapshot(fake):
+    _sync(20)
+    fake.uploads[:0] = range(109, 99, -1)
+
+    snapshot = _sync(5)
+
+    assert snapshot["video_ids"] == _ids(*range(109, 104, -1))
+    assert set(snapshot["videos"]) == set(snapshot["video_ids"])
+    assert not snapshot["complete"]
@@ -0,0 +1,64 @@
+"""Incremental comment sync (_sync_video_comments_async) against the fake Data API."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import fake_youtube  # noqa: E402
+import main  # noqa: E402
+
+VIDEO_ID = "vid00000001"
+
+
+def _sync(limit: int) -> tuple:
+    return main._run(main._sync_video_comments_async(VIDEO_ID, limit))
+
+
+def _ids(snapshot: dict) -> list:
+    return [c["comment_id"] for c in snapshot["comments"]]
+
+
+def _thread(n: int) -> str:
+    return f"thread{n:08d}"
+
+
+def test_poll_that_reaches_a_known_comment(fake):
+    _sync(50)
+    fake.new_comments += 3
+    before = fake.request_count
+
+    snapshot, new_count = _sync(50)
+
+    assert fake.request_count - before == 1
+    assert new_count == 3
+    assert _ids(snapshot)[:4] == [_thread(n) for n in (2002, 2001, 2000, 1999)]
+    assert len(snapshot["comments"]) == 50
+
+
+def test_poll_that_never_reaches_a_known_comment(fake):
+    _sync(20)
+    fake.new_comments += 30
+
+    snapshot, new_count = _sync(20)
+
+    assert new_count == 20
+    assert _ids(snapshot) == [_thread(n) for n in range(2029, 2009, -1)]
+    assert not snapshot["complete"]
+
+
+def test_window_is_capped_above_the_limit(fake, monkeypatch):
+    monkeypatch.setattr(main, "COMMENT_SNAPSHOT_MAX_COMMENTS", 30)
+    _sync(40)
+
+    # A caller asking for more than the cap still gets its full limit.
+    fake.new_comments += 5
+    snapshot, new_count = _sync(40)
+    assert new_count == 5
+    assert len(snapshot["comments"]) == 40
+
+    fake.new_comments += 5
+    snapshot, new_count = _sync(10)
+    assert new_count == 5
+    assert len(snapshot["comments"]) == 30
+    assert _ids(snapshot)[0] == _thread(fake_youtube.TOTAL_COMMENTS + 9)
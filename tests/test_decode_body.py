@@ -0,0 +1,21 @@
+"""Response body decoding in _fetch (no network)."""
+
+import gzip
+import sys
+import zlib
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main  # noqa: E402
+
+
+def test_empty_body_is_returned_unchanged_for_any_encoding():
+    for encoding in ("gzip", "deflate", "identity", ""):
+        assert main._decode_body(b"", encoding) == b""
+
+
+def test_gzip_and_deflate_bodies_are_decoded():
+    body = b'{"items": []}'
+    assert main._decode_body(gzip.compress(body), "gzip") == body
+    assert main._decode_body(zlib.compress(body), "deflate") == body
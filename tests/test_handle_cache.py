@@ -0,0 +1,50 @@
+"""Handle cache persistence (no network)."""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main  # noqa: E402
+
+
+def test_inserts_are_coalesced_into_one_write(tmp_path, monkeypatch):
+    writes = []
+    real_replace = os.replace
+    monkeypatch.setattr(main.os, "replace", lambda src, dst: (writes.append(dst), real_replace(src, dst)))
+    cache = main._HandleCache(tmp_path / "handles.json", ttl=3600, negative_ttl=60)
+
+    for n in range(50):
+        cache.put(f"chan{n}", main.ChannelRef(f"UCchan{n}", f"UUchan{n}"))
+    cache.put("typo", None)
+    assert writes == []
+
+    cache.flush()
+    cache.flush()
+    assert len(writes) == 1
+    stored = json.loads((tmp_path / "handles.json").read_text(encoding="utf-8"))
+    assert len(stored) == 51
+
+
+def test_flushed_entries_are_read_back(tmp_path):
+    path = tmp_path / "handles.json"
+    cache = main._HandleCache(path, ttl=3600, negative_ttl=60)
+    cache.put("Benchmark", main.ChannelRef("UCbench", "UUbench"))
+    cache.put("typo", None)
+    cache.flush()
+
+    reloaded = main._HandleCache(path, ttl=3600, negative_ttl=60)
+    assert reloaded.get("benchmark") == (True, main.ChannelRef("UCbench", "UUbench"))
+    assert reloaded.get("typo") == (True, None)
+    assert reloaded.get("unknown") == (False, None)
+
+
+def test_delayed_flush_writes_without_an_explicit_call(tmp_path, monkeypatch):
+    monkeypatch.setattr(main._HandleCache, "FLUSH_DELAY", 0.05)
+    path = tmp_path / "handles.json"
+    cache = main._HandleCache(path, ttl=3600, negative_ttl=60)
+    cache.put("later", main.ChannelRef("UClater", "UUlater"))
+    cache._timer.join(timeout=2)
+    assert "later" in json.loads(path.read_text(encoding="utf-8"))
@@ -0,0 +1,36 @@
+"""Keyword extraction for get_comment_keywords (no network)."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main  # noqa: E402
+
+
+def _words(text: str) -> list:
+    return list(main._keyword_analyzer.words(text))
+
+
+def test_runs_of_dots_and_hyphens_separate_words():
+    assert _words("wow...amazing") == ["wow", "amazing"]
+    assert _words("great--video") == ["great", "video"]
+
+
+def test_single_hyphen_joins_like_treebank():
+    # word_tokenize keeps "well-known" as one non-alphabetic token, which is dropped.
+    assert _words("a well-known fact.") == ["fact"]
+
+
+def test_markup_is_skipped():
+    text = 'see <a href="https://www.youtube.com/watch?v=x&amp;t=10">this part</a><br>thanks'
+    assert _words(text) == ["see", "part", "thanks"]
+
+
+def test_entities_are_unescaped_before_clitics_are_split():
+    assert _words("I&#39;m gonna say don&#39;t stop") == ["gon", "say", "stop"]
+
+
+def test_stopwords_are_the_bundled_list():
+    assert main._keyword_analyzer.stopwords is main._BUNDLED_STOPWORDS
+    assert len(main._BUNDLED_STOPWORDS) == 179
@@ -0,0 +1,88 @@
+"""Quota ledger and API key pool against the fake Data API's per-key quotas."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main  # noqa: E402
+
+
+@pytest.fixture
+def pool(fake, monkeypatch):
+    """Keys k1 and k2 with generous local limits, so upstream 403s drive rotation."""
+    day = ["2026-01-01"]
+    monkeypatch.setattr(main, "_quota_day", lambda: day[0])
+    monkeypatch.setattr(main, "_key_pool", main._KeyPool(["k1", "k2"], 10_000))
+    monkeypatch.setattr(main, "_quota", main._QuotaBudget(20_000, 20_000, 20_000))
+    return day
+
+
+def _keys() -> dict:
+    return {entry["key"]: entry for entry in main._key_pool.status()}
+
+
+def test_rotation_charges_the_ledger_once(fake, pool):
+    fake.key_quota["k1"] = 0
+
+    main.get_video_details("vid00000001")
+
+    assert fake.key_requests == {"k1": 1, "k2": 1}
+    assert main._quota.requests == 1
+    assert main._quota.spent == main.QUOTA_COSTS["videos"]
+    keys = _keys()
+    assert keys["...k1"]["exhausted"] and keys["...k1"]["units_spent"] == 0
+    assert keys["...k2"]["units_spent"] == main.QUOTA_COSTS["videos"]
+
+
+def test_hard_limit_refusal_releases_the_key_units(fake, pool, monkeypatch):
+    monkeypatch.setattr(main, "_quota", main._QuotaBudget(20_000, 20_000, 1))
+    main.get_video_details("vid00000001")
+    before = fake.request_count
+
+    with pytest.raises(main.QuotaExceededError):
+        main.get_video_details("vid00000002")
+
+    assert fake.request_count == before
+    assert sum(entry["units_spent"] for entry in main._key_pool.status()) == 1
+
+
+def test_exhausted_key_is_skipped_until_the_day_rolls_over(fake, pool):
+    fake.key_quota["k1"] = 0
+    main.get_video_details("vid00000001")
+    main.get_video_details("vid00000002")
+    assert fake.key_requests["k1"] == 1
+
+    pool[0] = "2026-01-02"
+    fake.key_quota["k1"] = 100
+    main.get_video_details("vid00000003")
+
+    assert fake.key_requests["k1"] == 2
+    assert not _keys()["...k1"]["exhausted"]
+
+
+def test_quota_exceeded_once_every_key_is_out(fake, pool):
+    fake.key_quota.update({"k1": 0, "k2": 0})
+
+    with pytest.raises(main.QuotaExceededError):
+        main.get_video_details("vid00000001")
+    assert all(entry["exhausted"] for entry in main._key_pool.status())
+
+    before = fake.request_count
+    with pytest.raises(main.QuotaExceededError):
+        main.get_video_details("vid00000002")
+    assert fake.request_count == before
+
+
+def test_quota_status_reports_payload_sizes_per_tool(fake, pool):
+    with main.track_call("get_video_details"):
+        main.get_video_details("vid00000001")
+
+    per_tool = main.get_quota_status()["per_tool"]["get_video_details"]
+
+    assert set(per_tool) == {
+        "calls", "avg_quota_units", "cache_hits", "avg_bytes_wire", "bytes_decoded", "decompress_ms",
+    }
+    assert per_tool["bytes_decoded"] > 0
@@ -0,0 +1,32 @@
+"""Synchronous wrappers over the async tools (local fake Data API)."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main  # noqa: E402
+
+
+def test_sync_call_from_plain_code(fake):
+    assert main.get_video_details("vid00000001")["video_id"] == "vid00000001"
+
+
+def test_sync_call_inside_a_running_loop(fake):
+    # As in a Jupyter cell: the calling thread already runs an event loop.
+    async def cell():
+        return main.get_video_details("vid00000002")
+
+    assert asyncio.run(cell())["video_id"] == "vid00000002"
+
+
+def test_sync_call_on_the_background_loop_raises():
+    async def nested():
+        return main._run(asyncio.sleep(0))
+
+    future = asyncio.run_coroutine_threadsafe(nested(), main._background_loop())
+    with pytest.raises(RuntimeError):
+        future.result()
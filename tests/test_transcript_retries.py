@@ -0,0 +1,59 @@
+"""Which transcript failures are retried (no network)."""
+
+import sys
+from pathlib import Path
+
+import pytest
+import requests
+from youtube_transcript_api import IpBlocked, YouTubeRequestFailed
+from youtube_transcript_api._transcripts import _raise_http_errors
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main  # noqa: E402
+
+
+def _library_error(status: int) -> Exception:
+    """The exception youtube-transcript-api itself raises for an HTTP status."""
+    response = requests.Response()
+    response.status_code = status
+    response.url = "https://www.youtube.com/api/timedtext"
+    try:
+        _raise_http_errors(response, "vid00000001")
+    except Exception as error:
+        return error
+    raise AssertionError(f"no error raised for {status}")
+
+
+def test_server_errors_are_retried():
+    for status in (500, 502, 503, 504):
+        error = _library_error(status)
+        assert isinstance(error, YouTubeRequestFailed)
+        assert main._is_transient_transcript_error(error)
+
+
+def test_client_errors_are_final():
+    for status in (400, 403, 404, 410):
+        assert not main._is_transient_transcript_error(_library_error(status))
+
+
+def test_rate_limit_is_final_and_does_not_trip_the_breaker(monkeypatch):
+    error = _library_error(429)
+    assert isinstance(error, IpBlocked)
+    calls = []
+
+    def blocked(video_id):
+        calls.append(video_id)
+        raise error
+
+    monkeypatch.setattr(main, "_fetch_transcript_raw", blocked)
+    with pytest.raises(ValueError):
+        main.get_video_transcript("vid00000001")
+
+    assert len(calls) == 1
+    assert main.get_breaker_status()["transcript"]["consecutive_failures"] == 0
+
+
+def test_connection_errors_are_retried():
+    assert main._is_transient_transcript_error(requests.ConnectionError("reset"))
+    assert main._is_transient_transcript_error(requests.Timeout("slow"))